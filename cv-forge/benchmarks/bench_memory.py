@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory needed to hold many loaded profiles.
+
+Parses N JSON profiles (as read from a profile store) into Resume and
+into CompactResume objects and compares the memory they keep alive.
+
+Usage:
+    python benchmarks/bench_memory.py [--profiles 100000] [--size small]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add cv-forge directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.compact import CompactResume
+from models.resume import Resume
+from benchmarks.synthetic import SIZES, make_sized_resume
+
+# Distinct profiles generated; payloads are reused cyclically but every
+# load parses its own copy, like reading from disk
+DISTINCT = 1000
+
+
+def measure(load, payloads, count: int):
+    """Return (retained MiB, seconds) for loading count profiles with load()."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    profiles = [load(json.loads(payloads[i % len(payloads)])) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del profiles
+    return retained / (1024 * 1024), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profiles", type=int, default=100000)
+    parser.add_argument("--size", default="small", choices=sorted(SIZES))
+    args = parser.parse_args()
+    
+    payloads = [json.dumps(make_sized_resume(args.size, seed=i).to_dict()) for i in range(DISTINCT)]
+    
+    resume_mb, resume_s = measure(Resume.from_dict, payloads, args.profiles)
+    compact_mb, compact_s = measure(CompactResume.from_dict, payloads, args.profiles)
+    
+    print(f"{args.profiles} profils '{args.size}' chargés")
+    print(f"Resume        : {resume_mb:8.1f} Mo ({resume_mb * 1024 * 1024 / args.profiles:6.0f} o/profil) en {resume_s:5.1f} s")
+    print(f"CompactResume : {compact_mb:8.1f} Mo ({compact_mb * 1024 * 1024 / args.profiles:6.0f} o/profil) en {compact_s:5.1f} s")
+    print(f"Gain mémoire  : x{resume_mb / compact_mb:.1f}")
+
+
+if __name__ == "__main__":
+    main()
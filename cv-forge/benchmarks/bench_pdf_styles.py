@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark: PDFExporter per-export setup time.
+
+Compares building the stylesheet for every export (previous behaviour)
+with the shared per-process style registry.
+
+Usage:
+    python benchmarks/bench_pdf_styles.py [--runs 2000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add cv-forge directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.resume import Resume
+from exporters.pdf_exporter import PDFExporter
+from exporters.pdf_styles import build_styles
+
+
+def time_per_call(func, runs: int) -> float:
+    """Average wall time of func() in microseconds."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+    
+    resume = Resume(first_name="Jean", last_name="Dupont")
+    
+    before = time_per_call(build_styles, args.runs)
+    after = time_per_call(lambda: PDFExporter(resume), args.runs)
+    
+    print(f"Setup par export, styles reconstruits : {before:8.1f} µs")
+    print(f"Setup par export, registre partagé    : {after:8.1f} µs")
+    print(f"Gain                                  : x{before / after:.0f}")
+
+
+if __name__ == "__main__":
+    main()
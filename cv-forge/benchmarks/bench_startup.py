@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark: GUI startup time.
+
+Launches `main.py --measure-startup` several times and reports the time
+from the start of main.py to the first Tk main loop iteration. Exits with
+status 1 when the median exceeds the target. Requires a display.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--target-ms 1000]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+MAIN = Path(__file__).parent.parent / "main.py"
+
+DEFAULT_TARGET_MS = 1000.0
+
+
+def measure_once() -> tuple:
+    """Return (startup_ms reported by main.py, wall time of the whole process in ms)."""
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, str(MAIN), "--measure-startup"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    wall_ms = (time.perf_counter() - start) * 1000
+    
+    for line in output.splitlines():
+        if line.startswith("startup_ms="):
+            return float(line.split("=", 1)[1]), wall_ms
+    raise RuntimeError(f"Sortie inattendue de main.py: {output!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS)
+    args = parser.parse_args()
+    
+    measure_once()  # Warm the OS file cache
+    runs = [measure_once() for _ in range(args.runs)]
+    startup = statistics.median(run[0] for run in runs)
+    wall = statistics.median(run[1] for run in runs)
+    
+    print(f"main.py -> première itération Tk : {startup:8.1f} ms (médiane sur {args.runs})")
+    print(f"Processus complet                : {wall:8.1f} ms")
+    print(f"Objectif                         : {args.target_ms:8.1f} ms")
+    
+    if startup > args.target_ms:
+        print("✗ Objectif de démarrage dépassé")
+        sys.exit(1)
+    print("✓ Objectif de démarrage respecté")
+
+
+if __name__ == "__main__":
+    main()
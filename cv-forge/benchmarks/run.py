@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+CV-Forge benchmark suite.
+
+Measures the resume model, both exporters, the profile codecs and every
+profile store on synthetic resumes, and writes the results as JSON so
+runs made before and after a change can be compared.
+
+Usage:
+    python benchmarks/run.py [--sizes page,small,medium,large] [--profiles 1000]
+                             [--only "pdf.*"] [--output results.json]
+                             [--thresholds benchmarks/thresholds.json]
+                             [--baseline before.json --tolerance 0.2]
+                             [--trace trace.json]
+
+Exit status is 1 when a threshold or the baseline tolerance is exceeded.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+# Add cv-forge directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.document import build_document
+from models.resume import Resume
+from exporters.pdf_exporter import PDFExporter
+from exporters.docx_exporter import DOCXExporter
+from exporters.multi_format import export_all
+from exporters.pdf_metrics import cache_stats
+from exporters.tracing import Tracer
+from storage.codecs import CODECS
+from storage.repository import open_repository
+from benchmarks.synthetic import SIZES, make_resume, make_sized_resume
+
+
+# Store backend -> file name (the extension selects the backend)
+STORES = {
+    "sqlite": "profiles.db",
+    "journal": "profiles.journal",
+    "json": "profiles.json",
+    "sharded": "profiles",
+}
+
+Benchmark = Tuple[str, Callable[[], None]]
+
+
+def measure(func: Callable[[], None], repeat: int) -> dict:
+    """Per-call timings of func() in milliseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    runs = [total / number * 1000 for total in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "median_ms": round(statistics.median(runs), 4),
+        "min_ms": round(min(runs), 4),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def model_benchmarks(sizes: List[str]) -> Iterator[Benchmark]:
+    for size in sizes:
+        resume = make_sized_resume(size)
+        data = resume.to_dict()
+        yield f"model.to_dict[{size}]", resume.to_dict
+        yield f"model.from_dict[{size}]", lambda data=data: Resume.from_dict(data)
+        yield f"model.build_document[{size}]", lambda r=resume: build_document(r)
+
+
+def codec_benchmarks(sizes: List[str]) -> Iterator[Benchmark]:
+    for size in sizes:
+        data = make_sized_resume(size).to_dict()
+        for name, codec in CODECS.items():
+            payload = codec.encode(data)
+            yield f"codec.encode[{name},{size}]", lambda c=codec, d=data: c.encode(d)
+            yield f"codec.decode[{name},{size}]", lambda c=codec, p=payload: c.decode(p)
+
+
+def export_benchmarks(sizes: List[str], directory: str) -> Iterator[Benchmark]:
+    for size in sizes:
+        resume = make_sized_resume(size)
+        pdf_path = os.path.join(directory, f"{size}.pdf")
+        docx_path = os.path.join(directory, f"{size}.docx")
+        yield f"pdf.export[{size}]", lambda r=resume, p=pdf_path: PDFExporter(r).export(p)
+        yield f"docx.export[{size}]", lambda r=resume, p=docx_path: DOCXExporter(r).export(p)
+        yield f"pdf.export_to_bytes[{size}]", lambda r=resume: PDFExporter(r).export_to_bytes()
+        yield f"pdf.export_to_bytes[{size},platypus]", lambda r=resume: PDFExporter(r, engine="platypus").export_to_bytes()
+        yield f"docx.export_to_bytes[{size}]", lambda r=resume: DOCXExporter(r).export_to_bytes()
+        yield f"docx.export_to_bytes[{size},stream]", lambda r=resume: DOCXExporter(r, engine="stream").export_to_bytes()
+        yield f"export_all[{size}]", lambda r=resume, d=os.path.join(directory, f"all-{size}"): export_all(r, d)
+    
+    # Distinct but similar resumes, as in a batch export (font-metric cache)
+    batch = [make_sized_resume("page", seed=seed) for seed in range(20)]
+    yield "pdf.export_to_bytes[batch,n=20]", lambda: [PDFExporter(r).export_to_bytes() for r in batch]
+
+
+def store_benchmarks(stores: List[str], count: int, directory: str) -> Iterator[Benchmark]:
+    profiles = [make_resume(seed=i).to_dict() for i in range(count)]
+    items = [(f"{data['first_name']} {data['last_name']}", data) for data in profiles]
+    keys = [key for key, _ in items]
+    
+    for store in stores:
+        path = Path(directory) / store / STORES[store]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        repository = open_repository(path)
+        repository.save_many(items)
+        repository.close()
+        
+        def reopen(path=path):
+            repo = open_repository(path)
+            repo.names()
+            repo.close()
+        
+        repository = open_repository(path)
+        cursor = iter(range(sys.maxsize))
+        label = f"{store},n={count}"
+        
+        yield f"store.open[{label}]", reopen
+        yield f"store.summaries[{label}]", repository.summaries
+        yield f"store.load[{label}]", lambda repo=repository: repo.load(keys[next(cursor) % count])
+        yield f"store.save[{label}]", lambda repo=repository: repo.save(*items[next(cursor) % count])
+        yield f"store.load_all[{label}]", repository.load_all
+        yield f"store.save_many[{label}]", lambda repo=repository: repo.save_many(items)
+        repository.close()
+
+
+def run(args) -> Dict[str, dict]:
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="cv-forge-bench-") as directory:
+        suites = (
+            model_benchmarks(args.sizes),
+            codec_benchmarks(args.sizes),
+            export_benchmarks(args.sizes, directory),
+            store_benchmarks(args.stores, args.profiles, directory),
+        )
+        for suite in suites:
+            for name, func in suite:
+                if args.only and args.only not in name and not fnmatch.fnmatch(name, args.only):
+                    continue
+                results[name] = measure(func, args.repeat)
+                print(f"{name:42s} {results[name]['median_ms']:10.3f} ms", file=sys.stderr)
+    return results
+
+
+def trace_exports(sizes: List[str], filepath: str) -> Dict[str, float]:
+    """Export each size once per engine with a tracer; returns ms per step."""
+    with Tracer() as tracer:
+        for size in sizes:
+            resume = make_sized_resume(size)
+            PDFExporter(resume, tracer=tracer).export_to_bytes()
+            PDFExporter(resume, engine="platypus", tracer=tracer).export_to_bytes()
+            DOCXExporter(resume, tracer=tracer).export_to_bytes()
+            DOCXExporter(resume, engine="stream", tracer=tracer).export_to_bytes()
+    tracer.write_chrome_trace(filepath)
+    return tracer.totals()
+
+
+def check(results: Dict[str, dict], thresholds: Dict[str, float], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Return one message per regression."""
+    failures = []
+    for name, limit_ms in thresholds.items():
+        if name in results and results[name]["median_ms"] > limit_ms:
+            failures.append(f"{name}: {results[name]['median_ms']:.3f} ms > seuil {limit_ms:.3f} ms")
+    
+    for name, before in baseline.items():
+        if name not in results:
+            continue
+        ratio = results[name]["median_ms"] / before["median_ms"]
+        if ratio > 1 + tolerance:
+            failures.append(f"{name}: x{ratio:.2f} par rapport à la référence")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="page,small,medium,large", help=f"Tailles de CV ({', '.join(SIZES)})")
+    parser.add_argument("--stores", default=",".join(STORES), help="Stockages à mesurer")
+    parser.add_argument("--profiles", type=int, default=1000, help="Nombre de profils stockés")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", help="Nom partiel ou motif des benchmarks à lancer (ex. 'pdf.*')")
+    parser.add_argument("--output", help="Fichier JSON des résultats ('-' pour la sortie standard)")
+    parser.add_argument("--thresholds", help="Fichier JSON {benchmark: médiane maximale en ms}")
+    parser.add_argument("--baseline", help="Résultats JSON d'un run précédent à comparer")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Ralentissement toléré par rapport à la référence")
+    parser.add_argument("--trace", help="Trace Chrome (JSON) des étapes de chaque export, hors mesures")
+    args = parser.parse_args()
+    
+    args.sizes = [size for size in args.sizes.split(",") if size]
+    args.stores = [store for store in args.stores.split(",") if store]
+    for size in args.sizes:
+        if size not in SIZES:
+            parser.error(f"Taille inconnue: {size}")
+    for store in args.stores:
+        if store not in STORES:
+            parser.error(f"Stockage inconnu: {store}")
+    
+    results = run(args)
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {"sizes": args.sizes, "stores": args.stores, "profiles": args.profiles, "repeat": args.repeat},
+        "results": results,
+        "pdf_metrics": cache_stats(),
+    }
+    if args.trace:
+        report["trace_totals_ms"] = trace_exports(args.sizes, args.trace)
+    
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    
+    thresholds = {}
+    if args.thresholds:
+        with open(args.thresholds, encoding="utf-8") as f:
+            thresholds = json.load(f)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    
+    failures = check(results, thresholds, baseline, args.tolerance)
+    for failure in failures:
+        print(f"✗ {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Synthetic resumes for CV-Forge benchmarks.
+Generates deterministic Resume objects of configurable size.
+"""
+
+import random
+from typing import Dict
+
+from models.resume import Resume, Education, Certification, Experience
+
+
+# Named sizes used by the benchmark suite
+SIZES: Dict[str, dict] = {
+    # Fits on one page (direct-canvas PDF engine)
+    "page": {"experiences": 2, "bullets": 3, "education": 1, "certifications": 1, "skills": 6},
+    "small": {"experiences": 2, "bullets": 3, "education": 1, "certifications": 1, "skills": 8},
+    "medium": {"experiences": 6, "bullets": 5, "education": 2, "certifications": 3, "skills": 20},
+    "large": {"experiences": 20, "bullets": 12, "education": 4, "certifications": 10, "skills": 80},
+}
+
+_WORDS = (
+    "développement conception pilotage migration optimisation équipe client "
+    "architecture livraison qualité performance sécurité données analyse "
+    "automatisation déploiement réduction coûts projet produit service"
+).split()
+
+_CITIES = ("Paris", "Lyon", "Nantes", "Lille", "Bordeaux", "Toulouse", "Marseille")
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:]
+
+
+def make_resume(
+    experiences: int = 6,
+    bullets: int = 5,
+    education: int = 2,
+    certifications: int = 3,
+    skills: int = 20,
+    seed: int = 0,
+) -> Resume:
+    """Build a resume with the given number of entries; same seed, same resume."""
+    rng = random.Random(seed)
+    
+    resume = Resume(
+        first_name=f"Jean{seed}",
+        last_name="Dupont",
+        phone="+33 6 12 34 56 78",
+        email=f"jean{seed}.dupont@example.fr",
+        linkedin=f"linkedin.com/in/jean{seed}",
+        address=rng.choice(_CITIES),
+        profile=_sentence(rng, 40),
+    )
+    
+    for i in range(education):
+        resume.education.append(Education(
+            diploma=f"Master {_sentence(rng, 2)}",
+            institution=f"Université de {rng.choice(_CITIES)}",
+            dates=f"{2010 + i}–{2012 + i}",
+        ))
+    
+    for i in range(certifications):
+        resume.certifications.append(Certification(
+            name=f"Certification {_sentence(rng, 2)}",
+            organization=rng.choice(("AWS", "Google", "Microsoft", "PMI")),
+            year=str(2015 + i % 10),
+        ))
+    
+    for i in range(experiences):
+        resume.experiences.append(Experience(
+            position=f"Ingénieur {rng.choice(_WORDS)}",
+            company=f"Entreprise {i}",
+            city=rng.choice(_CITIES),
+            start_date=f"{1 + i % 12:02d}/{2000 + i}",
+            end_date="Present" if i == 0 else f"{1 + i % 12:02d}/{2001 + i}",
+            bullets=[_sentence(rng, rng.randint(10, 25)) for _ in range(bullets)],
+        ))
+    
+    resume.skills_hard = [f"{rng.choice(_WORDS).capitalize()} {i}" for i in range(skills)]
+    resume.skills_soft = [rng.choice(_WORDS).capitalize() for _ in range(max(1, skills // 4))]
+    
+    return resume
+
+
+def make_sized_resume(size: str, seed: int = 0) -> Resume:
+    """Build a resume for one of the named SIZES."""
+    if size not in SIZES:
+        raise ValueError(f"Taille inconnue: {size}")
+    return make_resume(seed=seed, **SIZES[size])
@@ -0,0 +1,161 @@
+"""
+Batch Exporter for CV-Forge.
+Renders stored profiles headlessly, spreading the work across a process pool.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from models.resume import Resume
+from exporters import pdf_metrics
+from exporters.docx_exporter import DOCXExporter
+from exporters.pdf_exporter import PDFExporter
+from exporters.render_cache import RenderCache
+from exporters.text_exporter import TextExporter
+
+
+EXPORTERS = {
+    "pdf": PDFExporter,
+    # Headless exports write the package directly (same parts as python-docx)
+    "docx": partial(DOCXExporter, engine="stream"),
+    "txt": TextExporter,
+}
+
+SUPPORTED_FORMATS = tuple(EXPORTERS)
+
+
+@dataclass
+class ExportResult:
+    """Outcome of rendering one profile to one format."""
+    profile: str
+    fmt: str
+    filepath: str
+    error: Optional[str] = None
+    cached: bool = False
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def output_filename(data: dict, fmt: str) -> str:
+    """Build the same file name the GUI suggests: Nom_Prenom_CV.ext"""
+    stem = f"{data.get('last_name', '')}_{data.get('first_name', '')}_CV"
+    stem = re.sub(r'[\\/:*?"<>|]', "_", stem).strip()
+    return f"{stem}.{fmt}"
+
+
+def _init_worker() -> None:
+    """Worker processes only render resumes: let platypus use the cached metrics."""
+    pdf_metrics.install()
+
+
+def _unique_filename(filename: str, taken: Set[str]) -> str:
+    """
+    filename, or filename numbered _2, _3... when another profile of the
+    batch already uses it (compared case-insensitively, as on Windows).
+    """
+    stem, extension = os.path.splitext(filename)
+    candidate = filename
+    number = 1
+    while candidate.lower() in taken:
+        number += 1
+        candidate = f"{stem}_{number}{extension}"
+    taken.add(candidate.lower())
+    return candidate
+
+
+# One cache object per worker process, so its size estimate survives across tasks
+_caches: Dict[Tuple[str, int], RenderCache] = {}
+
+
+def _get_cache(cache_dir: Optional[str], cache_max_bytes: int) -> Optional[RenderCache]:
+    if cache_dir is None:
+        return None
+    key = (cache_dir, cache_max_bytes)
+    if key not in _caches:
+        _caches[key] = RenderCache(Path(cache_dir), max_bytes=cache_max_bytes)
+    return _caches[key]
+
+
+def _export_one(
+    profile: str,
+    data: dict,
+    fmt: str,
+    filepath: str,
+    cache_dir: Optional[str] = None,
+    cache_max_bytes: int = 0,
+) -> ExportResult:
+    """Render a single profile in a worker process."""
+    cache = _get_cache(cache_dir, cache_max_bytes)
+    hits = cache.hits if cache else 0
+    try:
+        resume = Resume.from_dict(data)
+        EXPORTERS[fmt](resume, cache=cache).export(filepath)
+    except Exception as e:
+        return ExportResult(profile, fmt, filepath, error=str(e))
+    return ExportResult(profile, fmt, filepath, cached=bool(cache and cache.hits > hits))
+
+
+def export_profiles(
+    profiles: Dict[str, dict],
+    output_dir: Path,
+    formats: Iterable[str] = SUPPORTED_FORMATS,
+    jobs: Optional[int] = None,
+    on_result: Optional[Callable[[ExportResult], None]] = None,
+    cache_dir: Optional[Path] = None,
+    cache_max_bytes: int = 512 * 1024 * 1024,
+) -> List[ExportResult]:
+    """
+    Export every profile to every requested format.
+    
+    A failing profile is reported in its ExportResult and never aborts
+    the rest of the batch. With jobs=1 everything runs in-process.
+    With cache_dir, unchanged resumes are copied from the render cache.
+    Profiles sharing a name get numbered files (Nom_Prenom_CV_2.pdf...)
+    instead of overwriting each other, in the order of profiles.
+    """
+    formats = list(formats)
+    unknown = [fmt for fmt in formats if fmt not in EXPORTERS]
+    if unknown:
+        raise ValueError(f"Format(s) non supporté(s): {', '.join(unknown)}")
+    
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    cache_dir = str(cache_dir) if cache_dir is not None else None
+    taken: Set[str] = set()
+    tasks = []
+    for profile, data in profiles.items():
+        for fmt in formats:
+            filepath = output_dir / _unique_filename(output_filename(data, fmt), taken)
+            tasks.append((profile, data, fmt, str(filepath), cache_dir, cache_max_bytes))
+    
+    results = []
+    
+    def collect(result: ExportResult) -> None:
+        results.append(result)
+        if on_result:
+            on_result(result)
+    
+    if jobs == 1 or len(tasks) <= 1:
+        for task in tasks:
+            collect(_export_one(*task))
+        return results
+    
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), initializer=_init_worker) as pool:
+        futures = {pool.submit(_export_one, *task): task for task in tasks}
+        for future in as_completed(futures):
+            profile, _, fmt, filepath = futures[future][:4]
+            try:
+                collect(future.result())
+            except Exception as e:
+                # The worker itself died (e.g. killed by the OS)
+                collect(ExportResult(profile, fmt, filepath, error=str(e)))
+    
+    return results
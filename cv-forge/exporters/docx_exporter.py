@@ -3,141 +3,143 @@ DOCX Exporter for CV-Forge.
 Generates ATS-friendly Word documents using python-docx.
 """
 
-from docx import Document
+import io
+from typing import BinaryIO, Optional, Union
+
 from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
+from models.document import EntryBlock, Header, ItemBlock, ListBlock, ResumeDocument, Section, TextBlock, build_document
 from models.resume import Resume
+from exporters import docx_stream, tracing
+from exporters.docx_template import new_document
+from exporters.errors import guarded
+from exporters.render_cache import RenderCache
+from exporters.tracing import Tracer
 
 
 class DOCXExporter:
-    """Export Resume to ATS-friendly DOCX format."""
+    """
+    Export Resume to ATS-friendly DOCX format.
+    
+    The default "python-docx" engine builds the document with python-docx.
+    "stream" writes the same paragraphs as XML straight into the package,
+    which is much cheaper for bulk generation; both produce the same parts.
+    """
+    
+    # Bump whenever the rendered output changes (invalidates cached renders)
+    FORMAT_VERSION = "1"
+    
+    ENGINES = ("python-docx", "stream")
     
-    def __init__(self, resume: Resume):
+    def __init__(
+        self,
+        resume: Resume,
+        cache: Optional[RenderCache] = None,
+        document: Optional[ResumeDocument] = None,
+        engine: str = "python-docx",
+        tracer: Optional[Tracer] = None,
+    ):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Moteur DOCX inconnu: {engine}")
         self.resume = resume
-        self.doc = Document()
-        self._setup_styles()
+        self.cache = cache
+        self._document = document
+        self.engine = engine
+        # Records the time spent in each rendering step when given
+        self.tracer = tracer
+        self._doc = None
+        self._built = False
     
-    def _setup_styles(self):
-        """Configure document styles for ATS compatibility."""
-        style = self.doc.styles['Normal']
-        font = style.font
-        font.name = 'Arial'
-        font.size = Pt(11)
+    @property
+    def doc(self):
+        """python-docx document being filled (only created by that engine)."""
+        if self._doc is None:
+            # Clone of the pre-styled base document (template parsed once per process)
+            self._doc = new_document()
+        return self._doc
+    
+    @property
+    def document(self) -> ResumeDocument:
+        """Document tree of the resume; pass it in to share it between exporters."""
+        if self._document is None:
+            self._document = build_document(self.resume)
+        return self._document
     
     def export(self, filepath: str) -> None:
         """Export the resume to a DOCX file."""
-        try:
-            self._add_header()
-            self._add_profile()
-            self._add_education()
-            self._add_certifications()
-            self._add_experiences()
-            self._add_skills()
-            self.doc.save(filepath)
-        except PermissionError:
-            raise Exception(f"Accès refusé: Impossible d'écrire le fichier {filepath}")
-        except IOError as e:
-            raise Exception(f"Erreur d'entrée/sortie: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Erreur lors de la génération du document: {str(e)}")
+        def render():
+            if self.cache is None:
+                self._render(filepath)
+            else:
+                key = self.cache.key_for(self.resume, "docx", self.FORMAT_VERSION)
+                self.cache.render_cached(key, filepath, lambda: self._render(filepath))
+        
+        guarded(render, filepath, "du document")
+    
+    def export_to_stream(self, fileobj: BinaryIO) -> None:
+        """Write the DOCX to a writable binary file object (left open)."""
+        guarded(lambda: self._render(fileobj), getattr(fileobj, "name", "<flux>"), "du document")
+    
+    def export_to_bytes(self) -> bytes:
+        """Render the DOCX in memory and return its content."""
+        buffer = io.BytesIO()
+        self.export_to_stream(buffer)
+        return buffer.getvalue()
     
-    def _add_header(self) -> None:
+    def _render(self, target: Union[str, BinaryIO]) -> None:
+        if self.engine == "stream":
+            with tracing.span(self.tracer, "docx", "docx_stream.write"):
+                docx_stream.write(self.document, target)
+            return
+        
+        if not self._built:
+            with tracing.span(self.tracer, "docx", "_add_header"):
+                self._add_header(self.document.header)
+            for section in self.document.sections:
+                if section.blocks:
+                    with tracing.span(self.tracer, "docx", "_add_section", section=section.title):
+                        self._add_section(section)
+            self._built = True
+        with tracing.span(self.tracer, "docx", "doc.save"):
+            self.doc.save(target)
+    
+    def _add_header(self, header: Header) -> None:
         """Add resume header with contact information."""
         # Name - centered, bold, larger
         name_para = self.doc.add_paragraph()
         name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        name_run = name_para.add_run(self.resume.full_name)
+        name_run = name_para.add_run(header.name)
         name_run.bold = True
         name_run.font.size = Pt(16)
         
         # Contact info - centered, simple text format
-        contact_lines = []
-        if self.resume.phone:
-            contact_lines.append(self.resume.phone)
-        if self.resume.email:
-            contact_lines.append(self.resume.email)
-        if self.resume.linkedin:
-            contact_lines.append(self.resume.linkedin)
-        if self.resume.address:
-            contact_lines.append(self.resume.address)
-        
-        if contact_lines:
+        if header.contact:
             contact_para = self.doc.add_paragraph()
             contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            contact_run = contact_para.add_run(" | ".join(contact_lines))
+            contact_run = contact_para.add_run(header.contact)
             contact_run.font.size = Pt(10)
         
         self.doc.add_paragraph()
     
-    def _add_profile(self) -> None:
-        """Add profile/summary section."""
-        if not self.resume.profile:
-            return
-        
-        self._add_section_title("PROFIL")
-        self.doc.add_paragraph(self.resume.profile)
-    
-    def _add_education(self) -> None:
-        """Add education section."""
-        if not self.resume.education:
-            return
-        
-        self._add_section_title("FORMATION")
-        
-        for edu in self.resume.education:
-            edu_text = f"{edu.diploma} – {edu.institution} – {edu.dates}"
-            self.doc.add_paragraph(edu_text)
-    
-    def _add_certifications(self) -> None:
-        """Add certifications section."""
-        if not self.resume.certifications:
-            return
-        
-        self._add_section_title("CERTIFICATION")
-        
-        for cert in self.resume.certifications:
-            cert_text = f"{cert.name} – {cert.organization} – {cert.year}"
-            self.doc.add_paragraph(cert_text)
-    
-    def _add_experiences(self) -> None:
-        """Add experience section."""
-        if not self.resume.experiences:
-            return
-        
-        self._add_section_title("EXPERIENCES PROFESSIONNELLES")
-        
-        for exp in self.resume.experiences:
-            dates_range = f"{exp.start_date} – {exp.end_date}"
-            exp_header = f"{exp.position} – {exp.company} – {exp.city} – {dates_range}"
-            
-            self.doc.add_paragraph(exp_header)
-            
-            for bullet in exp.bullets:
-                bullet_para = self.doc.add_paragraph(style='List Bullet')
-                bullet_para.add_run(bullet)
-    
-    def _add_skills(self) -> None:
-        """Add skills section."""
-        has_skills = self.resume.skills_hard or self.resume.skills_soft
-        if not has_skills:
-            return
-        
-        self._add_section_title("COMPETENCES")
-        
-        if self.resume.skills_hard:
-            skills_para = self.doc.add_paragraph()
-            skills_run = skills_para.add_run("Competences Techniques:\n")
-            skills_run.bold = True
-            for skill in self.resume.skills_hard:
-                skills_para.add_run(f"  • {skill}\n")
+    def _add_section(self, section: Section) -> None:
+        """Add a section title and its blocks."""
+        self._add_section_title(section.title)
         
-        if self.resume.skills_soft:
-            skills_para = self.doc.add_paragraph()
-            skills_run = skills_para.add_run("Competences Comportementales:\n")
-            skills_run.bold = True
-            for skill in self.resume.skills_soft:
-                skills_para.add_run(f"  • {skill}\n")
+        for block in section.blocks:
+            if isinstance(block, (TextBlock, ItemBlock)):
+                self.doc.add_paragraph(block.text)
+            elif isinstance(block, EntryBlock):
+                self.doc.add_paragraph(block.heading)
+                for bullet in block.bullets:
+                    bullet_para = self.doc.add_paragraph(style='List Bullet')
+                    bullet_para.add_run(bullet)
+            elif isinstance(block, ListBlock):
+                list_para = self.doc.add_paragraph()
+                label_run = list_para.add_run(f"{block.label}:\n")
+                label_run.bold = True
+                for item in block.items:
+                    list_para.add_run(f"  • {item}\n")
     
     def _add_section_title(self, title: str) -> None:
         """Add a section title with consistent formatting."""
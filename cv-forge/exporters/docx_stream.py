@@ -0,0 +1,141 @@
+"""
+Streaming DOCX engine for CV-Forge.
+Writes word/document.xml paragraph by paragraph straight into the zip
+package, without building a python-docx/lxml tree. The other parts
+(styles, List Bullet numbering, theme...) come from the styled base
+document and are compressed once per process.
+"""
+
+import io
+import re
+import threading
+import zipfile
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+from xml.sax.saxutils import escape
+
+from models.document import EntryBlock, Header, ItemBlock, ListBlock, ResumeDocument, Section, TextBlock
+from exporters.docx_template import base_document_bytes
+
+
+DOCUMENT_PART = "word/document.xml"
+
+# Same run properties as DOCXExporter (sizes in half-points)
+NAME_PROPERTIES = '<w:rPr><w:b/><w:sz w:val="32"/></w:rPr>'
+CONTACT_PROPERTIES = '<w:rPr><w:sz w:val="20"/></w:rPr>'
+TITLE_PROPERTIES = '<w:rPr><w:b/><w:sz w:val="24"/></w:rPr>'
+LABEL_PROPERTIES = '<w:rPr><w:b/></w:rPr>'
+CENTERED = '<w:pPr><w:jc w:val="center"/></w:pPr>'
+LIST_BULLET = '<w:pPr><w:pStyle w:val="ListBullet"/></w:pPr>'
+
+# Tabs and line breaks become their own run elements, as in python-docx
+_SPECIAL = re.compile(r"(\t|\r|\n)")
+# Characters lxml refuses to serialize
+_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+_lock = threading.Lock()
+_static: Optional[Tuple[bytes, str, str]] = None
+
+
+def _static_parts() -> Tuple[bytes, str, str]:
+    """
+    The base package without its main part, already compressed, and the
+    text of document.xml before and after the body content.
+    """
+    global _static
+    if _static is None:
+        with _lock:
+            if _static is None:
+                source = zipfile.ZipFile(io.BytesIO(base_document_bytes()))
+                buffer = io.BytesIO()
+                with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as package:
+                    for info in source.infolist():
+                        if info.filename != DOCUMENT_PART:
+                            package.writestr(info, source.read(info))
+                
+                xml = source.read(DOCUMENT_PART).decode("utf-8")
+                body = xml.index("<w:body>") + len("<w:body>")
+                section_properties = xml.index("<w:sectPr", body)
+                if xml[body:section_properties]:
+                    raise ValueError("Le modèle DOCX de base n'est pas vide")
+                _static = (buffer.getvalue(), xml[:body], xml[section_properties:])
+    return _static
+
+
+def _run(text: str, properties: str = "") -> str:
+    """A <w:r> holding text, laid out like python-docx's Run.text setter."""
+    if _INVALID.search(text):
+        raise ValueError("All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters")
+    
+    content = [properties]
+    for piece in _SPECIAL.split(text):
+        if piece == "\t":
+            content.append("<w:tab/>")
+        elif piece in ("\r", "\n"):
+            content.append("<w:br/>")
+        elif piece:
+            preserve = ' xml:space="preserve"' if len(piece.strip()) < len(piece) else ""
+            content.append(f"<w:t{preserve}>{escape(piece)}</w:t>")
+    
+    inner = "".join(content)
+    return f"<w:r>{inner}</w:r>" if inner else "<w:r/>"
+
+
+def _paragraph(*runs: str, properties: str = "") -> str:
+    inner = properties + "".join(runs)
+    return f"<w:p>{inner}</w:p>" if inner else "<w:p/>"
+
+
+def _text_paragraph(text: str) -> str:
+    """Document.add_paragraph(text): no run at all for empty text."""
+    return _paragraph(_run(text)) if text else _paragraph()
+
+
+def _header(header: Header) -> Iterator[str]:
+    yield _paragraph(_run(header.name, NAME_PROPERTIES), properties=CENTERED)
+    if header.contact:
+        yield _paragraph(_run(header.contact, CONTACT_PROPERTIES), properties=CENTERED)
+    yield _paragraph()
+
+
+def _section(section: Section) -> Iterator[str]:
+    yield _paragraph(_run(section.title, TITLE_PROPERTIES))
+    
+    for block in section.blocks:
+        if isinstance(block, (TextBlock, ItemBlock)):
+            yield _text_paragraph(block.text)
+        elif isinstance(block, EntryBlock):
+            yield _text_paragraph(block.heading)
+            for bullet in block.bullets:
+                yield _paragraph(_run(bullet), properties=LIST_BULLET)
+        elif isinstance(block, ListBlock):
+            runs = [_run(f"{block.label}:\n", LABEL_PROPERTIES)]
+            runs.extend(_run(f"  • {item}\n") for item in block.items)
+            yield _paragraph(*runs)
+
+
+def body_paragraphs(document: ResumeDocument) -> Iterator[str]:
+    """The <w:p> elements DOCXExporter adds for the document, in order."""
+    yield from _header(document.header)
+    for section in document.sections:
+        if section.blocks:
+            yield from _section(section)
+
+
+def write(document: ResumeDocument, target: Union[str, BinaryIO]) -> None:
+    """Write the .docx package of the document to a path or binary stream."""
+    package_bytes, prefix, suffix = _static_parts()
+    buffer = io.BytesIO()
+    buffer.write(package_bytes)
+    
+    with zipfile.ZipFile(buffer, "a", zipfile.ZIP_DEFLATED) as package:
+        with package.open(DOCUMENT_PART, "w") as part:
+            part.write(prefix.encode("utf-8"))
+            for paragraph in body_paragraphs(document):
+                part.write(paragraph.encode("utf-8"))
+            part.write(suffix.encode("utf-8"))
+    
+    if isinstance(target, str):
+        with open(target, "wb") as f:
+            f.write(buffer.getbuffer())
+    else:
+        target.write(buffer.getbuffer())
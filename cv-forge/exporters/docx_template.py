@@ -0,0 +1,139 @@
+"""
+DOCX base document cache for CV-Forge.
+The default python-docx template is parsed and styled once per process;
+each export then gets a cheap clone of that base document whose mutable
+parts are its own.
+"""
+
+import copy
+import io
+import threading
+from typing import Optional
+
+from docx import Document
+from docx.document import Document as DocumentObject
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.part import Part, XmlPart
+from docx.package import Package
+from docx.parts.document import DocumentPart
+from docx.parts.styles import StylesPart
+from docx.shared import Pt
+
+
+_lock = threading.Lock()
+_base_bytes: Optional[bytes] = None
+_base_document: Optional[DocumentObject] = None
+
+
+def _setup_styles(doc: DocumentObject) -> None:
+    """Configure document styles for ATS compatibility."""
+    style = doc.styles['Normal']
+    font = style.font
+    font.name = 'Arial'
+    font.size = Pt(11)
+
+
+def base_document_bytes() -> bytes:
+    """The styled, empty base document serialized as a .docx package."""
+    global _base_bytes
+    if _base_bytes is None:
+        with _lock:
+            if _base_bytes is None:
+                doc = Document()
+                _setup_styles(doc)
+                buffer = io.BytesIO()
+                doc.save(buffer)
+                _base_bytes = buffer.getvalue()
+    return _base_bytes
+
+
+def _get_base_document() -> DocumentObject:
+    global _base_document
+    if _base_document is None:
+        data = base_document_bytes()
+        with _lock:
+            if _base_document is None:
+                _base_document = Document(io.BytesIO(data))
+    return _base_document
+
+
+def _own_copy(part: Part, package: Package) -> Part:
+    """
+    The part itself if python-docx can only read it (theme, fonts and
+    other binary parts), else a copy of its XML for one document.
+    """
+    if not isinstance(part, XmlPart):
+        return part
+    return type(part)(part.partname, part.content_type, copy.deepcopy(part.element), package)
+
+
+class _ClonedDocumentPart(DocumentPart):
+    """
+    Main part of a cloned document.
+    
+    Settings, numbering and core properties are copied with the clone.
+    The large styles part is shared with the base document until
+    doc.styles (or a Style object) is first asked for, and only copied
+    then, so looking up a style id by name stays free.
+    """
+    
+    _styles_copied = False
+    
+    def get_style_id(self, style_or_name, style_type):
+        if self._styles_copied:
+            return super().get_style_id(style_or_name, style_type)
+        # Read-only lookup in the shared styles
+        return super()._styles_part.styles.get_style_id(style_or_name, style_type)
+    
+    @property
+    def _styles_part(self) -> StylesPart:
+        styles_part = super()._styles_part
+        if not self._styles_copied:
+            self._styles_copied = True
+            for rel in self.rels.values():
+                if rel.reltype == RT.STYLES:
+                    styles_part = _own_copy(styles_part, self.package)
+                    self.rels.add_relationship(RT.STYLES, styles_part, rel.rId)
+                    break
+        return styles_part
+
+
+def new_document() -> DocumentObject:
+    """
+    Return an empty, styled document ready to be filled.
+    
+    The main document part, settings, numbering and core properties are
+    copied, so nothing done to one document (doc.settings,
+    doc.core_properties, doc.styles...) reaches the base document or
+    other exports, even on other threads. The large styles.xml is never
+    parsed again and only copied if the document's styles are accessed.
+    """
+    base_part = _get_base_document().part
+    
+    package = Package()
+    part = _ClonedDocumentPart(
+        base_part.partname,
+        base_part.content_type,
+        copy.deepcopy(base_part.element),
+        package,
+    )
+    
+    for rel in base_part.rels.values():
+        if rel.is_external:
+            target = rel.target_ref
+        elif rel.reltype == RT.STYLES:
+            target = rel.target_part  # Copied on first access
+        else:
+            target = _own_copy(rel.target_part, package)
+        part.rels.add_relationship(rel.reltype, target, rel.rId, rel.is_external)
+    
+    for rel in base_part.package.rels.values():
+        if rel.reltype == RT.OFFICE_DOCUMENT:
+            target = part
+        elif rel.is_external:
+            target = rel.target_ref
+        else:
+            target = _own_copy(rel.target_part, package)
+        package.rels.add_relationship(rel.reltype, target, rel.rId, rel.is_external)
+    
+    return part.document
@@ -0,0 +1,23 @@
+"""
+Export error handling for CV-Forge.
+Turns failures while rendering a document into the user-facing messages
+shown by the GUI and the command line.
+"""
+
+from typing import Callable
+
+
+def guarded(render: Callable[[], None], target, what: str) -> None:
+    """
+    Run render() and turn failures into user-facing errors.
+    target names the output (path or stream name); what names the
+    document in the generic message, e.g. "du PDF".
+    """
+    try:
+        render()
+    except PermissionError:
+        raise Exception(f"Accès refusé: Impossible d'écrire le fichier {target}")
+    except IOError as e:
+        raise Exception(f"Erreur d'entrée/sortie: {str(e)}")
+    except Exception as e:
+        raise Exception(f"Erreur lors de la génération {what}: {str(e)}")
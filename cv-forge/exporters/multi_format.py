@@ -0,0 +1,84 @@
+"""
+Multi-format Exporter for CV-Forge.
+Renders one resume to several formats at once, each format on its own
+worker, sharing a single document tree.
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+
+from models.document import ResumeDocument, build_document
+from models.resume import Resume
+from exporters.batch import EXPORTERS, SUPPORTED_FORMATS, ExportResult, output_filename
+
+
+def _export_format(
+    profile: str,
+    resume: Resume,
+    document: ResumeDocument,
+    fmt: str,
+    filepath: str,
+) -> ExportResult:
+    """Render one format (top-level so that process pools can run it too)."""
+    try:
+        EXPORTERS[fmt](resume, document=document).export(filepath)
+    except Exception as e:
+        return ExportResult(profile, fmt, filepath, error=str(e))
+    return ExportResult(profile, fmt, filepath)
+
+
+def export_all(
+    resume: Resume,
+    output_dir: Path,
+    formats: Iterable[str] = SUPPORTED_FORMATS,
+    executor: Optional[Executor] = None,
+    on_result: Optional[Callable[[ExportResult], None]] = None,
+) -> List[ExportResult]:
+    """
+    Export one resume to every requested format concurrently.
+    
+    Files are named like the GUI suggests (Nom_Prenom_CV.ext). The document
+    tree is built once and shared by all exporters. Formats render on a
+    thread per format unless an executor (e.g. a process pool) is given.
+    Returns once every format is done, one ExportResult per format in the
+    requested order; a failing format never aborts the others.
+    """
+    formats = list(dict.fromkeys(formats))
+    unknown = [fmt for fmt in formats if fmt not in EXPORTERS]
+    if unknown:
+        raise ValueError(f"Format(s) non supporté(s): {', '.join(unknown)}")
+    
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    data = resume.to_dict()
+    profile = f"{resume.first_name} {resume.last_name}".strip()
+    document = build_document(resume)
+    tasks = [
+        (profile, resume, document, fmt, str(output_dir / output_filename(data, fmt)))
+        for fmt in formats
+    ]
+    
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max(len(tasks), 1), thread_name_prefix="cv-forge-export-all")
+    
+    try:
+        futures = [executor.submit(_export_format, *task) for task in tasks]
+        results = []
+        for task, future in zip(tasks, futures):
+            fmt, filepath = task[3:]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. a process pool was killed)
+                result = ExportResult(profile, fmt, filepath, error=str(e))
+            results.append(result)
+            if on_result:
+                on_result(result)
+    finally:
+        if own_executor:
+            executor.shutdown()
+    
+    return results
@@ -0,0 +1,118 @@
+"""
+PDF Book Exporter for CV-Forge.
+Renders many resumes into one combined PDF (one candidate per section,
+each with its own bookmark), building each resume's flowables only when
+the layout reaches it.
+"""
+
+import io
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Union
+
+from reportlab.platypus import Flowable, PageBreak, SimpleDocTemplate
+
+from models.resume import Resume
+from exporters.errors import guarded
+from exporters.pdf_exporter import PDFExporter
+from exporters.pdf_styles import DEFAULT_FONT, DEFAULT_THEME, MARGIN, PAGE_SIZE
+
+
+class _Bookmark(Flowable):
+    """Zero-size flowable adding an outline entry for the page it lands on."""
+    
+    def __init__(self, key: str, title: str):
+        super().__init__()
+        self.key = key
+        self.title = title
+    
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+    
+    def draw(self):
+        self.canv.bookmarkPage(self.key)
+        self.canv.addOutlineEntry(self.title, self.key, level=0)
+
+
+class _StoryStream(list):
+    """
+    Story that refills itself one resume at a time as platypus consumes it.
+    
+    doc.build() only takes flowables from the front of the list and checks
+    len() to know whether any are left, so only the resume being laid out
+    is ever held in memory.
+    """
+    
+    def __init__(self, chunks: Iterator[list]):
+        super().__init__()
+        self._chunks = chunks
+    
+    def __len__(self) -> int:
+        while not super().__len__():
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self.extend(chunk)
+        return super().__len__()
+
+
+class PDFBookExporter:
+    """
+    Export several resumes into a single PDF, each starting on a new page.
+    
+    resumes may be any iterable, e.g. a generator loading profiles one by
+    one; it is consumed once, so each book exporter exports once.
+    """
+    
+    def __init__(
+        self,
+        resumes: Iterable[Resume],
+        theme: str = DEFAULT_THEME,
+        font_name: str = DEFAULT_FONT,
+        title: str = "Sélection de candidats",
+    ):
+        self.resumes = resumes
+        self.theme = theme
+        self.font_name = font_name
+        self.title = title
+        self.count = 0
+    
+    def export(self, filepath: str) -> None:
+        """Export the book to a PDF file."""
+        guarded(lambda: self._render(filepath), filepath, "du PDF")
+    
+    def export_to_stream(self, fileobj: BinaryIO) -> None:
+        """Write the book to a writable binary file object (left open)."""
+        guarded(lambda: self._render(fileobj), getattr(fileobj, "name", "<flux>"), "du PDF")
+    
+    def export_to_bytes(self) -> bytes:
+        """Render the book in memory and return its content."""
+        buffer = io.BytesIO()
+        self.export_to_stream(buffer)
+        return buffer.getvalue()
+    
+    def _render(self, target: Union[str, BinaryIO]) -> None:
+        doc = SimpleDocTemplate(
+            target,
+            pagesize=PAGE_SIZE,
+            leftMargin=MARGIN,
+            rightMargin=MARGIN,
+            topMargin=MARGIN,
+            bottomMargin=MARGIN,
+            title=self.title,
+        )
+        doc.build(_StoryStream(self._chunks()), onFirstPage=self._show_outline)
+    
+    def _chunks(self) -> Iterator[List[Flowable]]:
+        """Flowables of one candidate at a time, built when platypus needs them."""
+        self.count = 0
+        for resume in self.resumes:
+            chunk = [PageBreak()] if self.count else []
+            chunk.append(_Bookmark(f"candidate-{self.count}", resume.full_name.strip() or f"Candidat {self.count + 1}"))
+            chunk.extend(PDFExporter(resume, self.theme, self.font_name).story())
+            self.count += 1
+            yield chunk
+        if not self.count:
+            raise ValueError("Aucun CV à exporter")
+    
+    @staticmethod
+    def _show_outline(canvas, doc) -> None:
+        canvas.showOutline()
@@ -0,0 +1,216 @@
+"""
+Direct-canvas PDF engine for CV-Forge.
+Lays out a resume with the same styles, line wrapping and spacing rules
+as the platypus flowables and draws it straight onto a reportlab Canvas.
+Only single-page resumes are handled; layout() returns None otherwise.
+"""
+
+from typing import BinaryIO, List, Mapping, Optional, Sequence, Tuple, Union
+
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.fonts import tt2ps
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.pdfgen.canvas import Canvas
+
+from models.document import EntryBlock, ItemBlock, ListBlock, ResumeDocument, TextBlock
+from exporters import tracing
+from exporters.pdf_metrics import Unwrappable, wrap_lines
+from exporters.pdf_styles import ENTRY_GAP, HEADER_GAP, ITEM_GAP, LIST_GAP, MARGIN, PAGE_SIZE, SECTION_GAP
+
+
+# Frame of SimpleDocTemplate: page minus margins, with reportlab's 6pt padding
+FRAME_PADDING = 6
+FRAME_X = MARGIN + FRAME_PADDING
+FRAME_TOP = PAGE_SIZE[1] - MARGIN - FRAME_PADDING
+FRAME_BOTTOM = MARGIN + FRAME_PADDING
+FRAME_WIDTH = PAGE_SIZE[0] - 2 * (MARGIN + FRAME_PADDING)
+
+# Same tolerance as reportlab's frame placement
+FUZZ = 1e-6
+
+# Markup, non-breaking spaces and soft hyphens are only handled by platypus
+UNSUPPORTED_CHARACTERS = frozenset("<>&\xa0\xad")
+
+
+class _Unsupported(Exception):
+    """The resume needs the platypus engine (too long, markup, overlong word)."""
+
+
+def _wrap(text: str, font_name: str, font_size: float, max_width: float, mixed: bool) -> Tuple[Tuple[float, str], ...]:
+    """Lines of text from the shared wrap cache, or _Unsupported."""
+    if UNSUPPORTED_CHARACTERS.intersection(text):
+        raise _Unsupported()
+    try:
+        lines = wrap_lines(text, font_name, font_size, max_width, mixed)
+    except Unwrappable:
+        raise _Unsupported()  # platypus splits the word itself
+    if not lines:
+        raise _Unsupported()
+    return lines
+
+
+class PlacedParagraph:
+    """
+    A paragraph broken into lines of (font name, x offset, text), and the
+    position of its first baseline once placed on the page.
+    """
+    
+    __slots__ = ("style", "lines", "x", "y")
+    
+    def __init__(self, style: ParagraphStyle, segments: Sequence[Tuple[str, str]]):
+        """segments: (font name, text) pairs, each starting on a new line."""
+        max_width = FRAME_WIDTH - style.leftIndent - style.rightIndent
+        mixed = len(segments) > 1
+        center = style.alignment == TA_CENTER
+        self.style = style
+        self.lines = [
+            (font_name, 0.5 * extra if center else 0, text)
+            for font_name, segment in segments
+            for extra, text in _wrap(segment, font_name, style.fontSize, max_width, mixed)
+        ]
+        self.x = FRAME_X + style.leftIndent
+        self.y = 0.0
+    
+    @property
+    def height(self) -> float:
+        return len(self.lines) * self.style.leading
+
+
+def _group_height(paragraphs: Sequence[PlacedParagraph]) -> float:
+    """Height of a KeepTogether group, measured like platypus' _listWrapOn."""
+    height = 0
+    space_after = None
+    for paragraph in paragraphs:
+        if space_after is not None:
+            height += space_after + max(paragraph.style.spaceBefore - space_after, 0)
+        height += paragraph.height
+        space_after = paragraph.style.spaceAfter
+    return height
+
+
+class _Frame:
+    """
+    Vertical placement with the rules of platypus Frame.add(): the space
+    after a paragraph overlaps the space before the next one, spacers add
+    their height, and nothing may go below the bottom of the page.
+    """
+    
+    def __init__(self):
+        self.y = FRAME_TOP
+        self.at_top = True
+        self.space_after = 0
+        self.paragraphs: List[PlacedParagraph] = []
+    
+    def paragraph(self, paragraph: PlacedParagraph) -> None:
+        style = paragraph.style
+        space = 0 if self.at_top else max(style.spaceBefore - self.space_after, 0)
+        bottom = self.y - space - paragraph.height
+        if bottom < FRAME_BOTTOM - FUZZ:
+            raise _Unsupported()
+        
+        paragraph.y = bottom + paragraph.height - style.fontSize
+        self.paragraphs.append(paragraph)
+        self._advance(bottom - style.spaceAfter, style.spaceAfter)
+    
+    def keep_together(self, paragraphs: Sequence[PlacedParagraph]) -> None:
+        """Add paragraphs that platypus would move to the next page as a whole."""
+        if _group_height(paragraphs) > self.y - FRAME_BOTTOM:
+            raise _Unsupported()
+        for paragraph in paragraphs:
+            self.paragraph(paragraph)
+    
+    def spacer(self, height: float) -> None:
+        bottom = self.y - height
+        if bottom < FRAME_BOTTOM - FUZZ:
+            raise _Unsupported()
+        self._advance(bottom, 0)
+    
+    def _advance(self, y: float, space_after: float) -> None:
+        if y != self.y:
+            self.at_top = False
+        self.y = y
+        self.space_after = space_after
+
+
+def layout(
+    document: ResumeDocument,
+    styles: Mapping[str, ParagraphStyle],
+    tracer: Optional[tracing.Tracer] = None,
+) -> Optional[List[PlacedParagraph]]:
+    """
+    Paragraphs of the single page holding the whole resume, or None when the
+    resume needs more than one page or text that only platypus handles.
+    Mirrors the story built by PDFExporter block by block; the header and
+    each section are traced as layout_header and layout_section steps.
+    """
+    normal = styles['Normal']
+    bullet = styles['CustomBullet']
+    bold = tt2ps(normal.fontName, 1, 0)
+    
+    def paragraph(style: ParagraphStyle, text: str) -> PlacedParagraph:
+        return PlacedParagraph(style, [(style.fontName, text)])
+    
+    frame = _Frame()
+    try:
+        header = document.header
+        with tracing.span(tracer, "pdf", "layout_header"):
+            frame.paragraph(paragraph(styles['HeaderName'], header.name))
+            if header.contact:
+                frame.paragraph(paragraph(styles['ContactInfo'], header.contact))
+            frame.spacer(HEADER_GAP)
+        
+        for section in document.sections:
+            if not section.blocks:
+                continue
+            with tracing.span(tracer, "pdf", "layout_section", section=section.title):
+                frame.paragraph(paragraph(styles['SectionTitle'], section.title.upper()))
+                
+                previous = None
+                for block in section.blocks:
+                    if isinstance(block, TextBlock):
+                        frame.paragraph(paragraph(normal, block.text))
+                    elif isinstance(block, ItemBlock):
+                        frame.paragraph(paragraph(normal, block.text))
+                        frame.spacer(ITEM_GAP)
+                    elif isinstance(block, EntryBlock):
+                        job = [paragraph(normal, block.heading)]
+                        job.extend(paragraph(bullet, f"• {text}") for text in block.bullets)
+                        frame.keep_together(job)
+                        frame.spacer(ENTRY_GAP)
+                    elif isinstance(block, ListBlock):
+                        if isinstance(previous, ListBlock):
+                            frame.spacer(LIST_GAP)
+                        segments = [(bold, f"{block.label}:")]
+                        segments.extend((normal.fontName, f"• {item}") for item in block.items)
+                        frame.paragraph(PlacedParagraph(normal, segments))
+                    previous = block
+                
+                frame.spacer(SECTION_GAP)
+    except _Unsupported:
+        return None
+    return frame.paragraphs
+
+
+def draw(paragraphs: Sequence[PlacedParagraph], target: Union[str, BinaryIO]) -> None:
+    """
+    Write the laid-out paragraphs as a one-page PDF. Each paragraph is one
+    text object advancing line by line, like platypus draws it, so text
+    extraction sees the same line structure.
+    """
+    canvas = Canvas(target, pagesize=PAGE_SIZE)
+    for paragraph in paragraphs:
+        style = paragraph.style
+        text = canvas.beginText(paragraph.x, paragraph.y)
+        font_name = None
+        for line_font, offset, line in paragraph.lines:
+            if line_font != font_name:
+                font_name = line_font
+                text.setFont(font_name, style.fontSize, style.leading)
+            if offset:
+                text.setXPos(offset)
+            text.textLine(line)
+            if offset:
+                text.setXPos(-offset)
+        canvas.drawText(text)
+    canvas.showPage()
+    canvas.save()
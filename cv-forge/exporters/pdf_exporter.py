@@ -3,200 +3,160 @@ PDF Exporter for CV-Forge.
 Generates ATS-friendly PDF documents using reportlab.
 """
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
+import io
+from typing import BinaryIO, Optional, Union
+
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, KeepTogether
 
+from models.document import EntryBlock, Header, ItemBlock, ListBlock, ResumeDocument, Section, TextBlock, build_document
 from models.resume import Resume
+from exporters import pdf_canvas, tracing
+from exporters.errors import guarded
+from exporters.pdf_styles import (
+    DEFAULT_FONT,
+    DEFAULT_THEME,
+    ENTRY_GAP,
+    HEADER_GAP,
+    ITEM_GAP,
+    LIST_GAP,
+    MARGIN,
+    PAGE_SIZE,
+    SECTION_GAP,
+    get_styles,
+)
+from exporters.render_cache import RenderCache
+from exporters.tracing import Tracer
 
 
 class PDFExporter:
-    """Export Resume to ATS-friendly PDF format."""
+    """
+    Export Resume to ATS-friendly PDF format.
+    
+    The default "auto" engine draws resumes that fit on one page straight
+    onto a canvas, with the same text and positions as the platypus
+    layout, and falls back to platypus for longer ones. "platypus"
+    always uses the flowable layout.
+    """
+    
+    # Bump whenever the rendered output changes (invalidates cached renders)
+    FORMAT_VERSION = "3"
+    
+    ENGINES = ("auto", "platypus")
     
-    def __init__(self, resume: Resume):
+    def __init__(
+        self,
+        resume: Resume,
+        theme: str = DEFAULT_THEME,
+        font_name: str = DEFAULT_FONT,
+        cache: Optional[RenderCache] = None,
+        document: Optional[ResumeDocument] = None,
+        engine: str = "auto",
+        tracer: Optional[Tracer] = None,
+    ):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Moteur PDF inconnu: {engine}")
         self.resume = resume
-        self.styles = getSampleStyleSheet()
-        self._setup_styles()
+        self._document = document
+        self.theme = theme
+        self.font_name = font_name
+        self.cache = cache
+        self.engine = engine
+        # Records the time spent in each rendering step when given
+        self.tracer = tracer
+        # Shared, read-only styles built once per process
+        self.styles = get_styles(theme, font_name)
     
-    def _setup_styles(self):
-        """Configure styles for ATS-compatible PDF."""
-        font_name = 'Helvetica'  # Default fallback
-        
-        # Normal text style
-        self.styles['Normal'].fontName = font_name
-        self.styles['Normal'].fontSize = 11
-        
-        # Section title style
-        if 'SectionTitle' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='SectionTitle',
-                parent=self.styles['Heading2'],
-                fontName=font_name,
-                fontSize=12,
-                textColor=colors.black,
-                spaceBefore=12,
-                spaceAfter=6,
-                textTransform='uppercase',
-            ))
-        
-        # Header name style
-        if 'HeaderName' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='HeaderName',
-                parent=self.styles['Heading1'],
-                fontName=font_name,
-                fontSize=16,
-                alignment=1,  # Center
-                spaceAfter=6,
-            ))
-        
-        # Contact info style
-        if 'ContactInfo' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='ContactInfo',
-                parent=self.styles['Normal'],
-                fontName=font_name,
-                fontSize=10,
-                alignment=1,  # Center
-                spaceAfter=12,
-            ))
-        
-        # Bullet style
-        if 'CustomBullet' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='CustomBullet',
-                parent=self.styles['Normal'],
-                fontName=font_name,
-                fontSize=11,
-                leftIndent=20,
-                spaceAfter=3,
-            ))
+    @property
+    def document(self) -> ResumeDocument:
+        """Document tree of the resume; pass it in to share it between exporters."""
+        if self._document is None:
+            self._document = build_document(self.resume)
+        return self._document
     
     def export(self, filepath: str) -> None:
         """Export the resume to a PDF file."""
-        try:
-            doc = SimpleDocTemplate(
-                filepath,
-                pagesize=A4,
-                leftMargin=0.75 * inch,
-                rightMargin=0.75 * inch,
-                topMargin=0.75 * inch,
-                bottomMargin=0.75 * inch,
-            )
-            
-            story = []
-            
-            self._build_header(story)
-            self._build_profile(story)
-            self._build_education(story)
-            self._build_certifications(story)
-            self._build_experiences(story)
-            self._build_skills(story)
-            
-            doc.build(story)
-        except PermissionError:
-            raise Exception(f"Accès refusé: Impossible d'écrire le fichier {filepath}")
-        except IOError as e:
-            raise Exception(f"Erreur d'entrée/sortie: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Erreur lors de la génération du PDF: {str(e)}")
+        def render():
+            if self.cache is None:
+                self._render(filepath)
+            else:
+                version = f"{self.FORMAT_VERSION}:{self.theme}:{self.font_name}:{self.engine}"
+                key = self.cache.key_for(self.resume, "pdf", version)
+                self.cache.render_cached(key, filepath, lambda: self._render(filepath))
+        
+        guarded(render, filepath, "du PDF")
     
-    def _build_header(self, story: list) -> None:
-        """Add resume header with contact information."""
-        story.append(Paragraph(self.resume.full_name, self.styles['HeaderName']))
-        
-        contact_lines = []
-        if self.resume.phone:
-            contact_lines.append(self.resume.phone)
-        if self.resume.email:
-            contact_lines.append(self.resume.email)
-        if self.resume.linkedin:
-            contact_lines.append(self.resume.linkedin)
-        if self.resume.address:
-            contact_lines.append(self.resume.address)
-        
-        if contact_lines:
-            contact_text = " | ".join(contact_lines)
-            story.append(Paragraph(contact_text, self.styles['ContactInfo']))
-        
-        story.append(Spacer(1, 0.15 * inch))
+    def export_to_stream(self, fileobj: BinaryIO) -> None:
+        """Write the PDF to a writable binary file object (left open)."""
+        guarded(lambda: self._render(fileobj), getattr(fileobj, "name", "<flux>"), "du PDF")
     
-    def _build_profile(self, story: list) -> None:
-        """Add profile/summary section."""
-        if not self.resume.profile:
-            return
-        
-        story.append(Paragraph("PROFIL", self.styles['SectionTitle']))
-        story.append(Paragraph(self.resume.profile, self.styles['Normal']))
-        story.append(Spacer(1, 0.1 * inch))
+    def export_to_bytes(self) -> bytes:
+        """Render the PDF in memory and return its content."""
+        buffer = io.BytesIO()
+        self.export_to_stream(buffer)
+        return buffer.getvalue()
     
-    def _build_education(self, story: list) -> None:
-        """Add education section."""
-        if not self.resume.education:
-            return
-        
-        story.append(Paragraph("FORMATION", self.styles['SectionTitle']))
-        
-        for edu in self.resume.education:
-            edu_text = f"{edu.diploma} – {edu.institution} – {edu.dates}"
-            story.append(Paragraph(edu_text, self.styles['Normal']))
-            story.append(Spacer(1, 4))
-        
-        story.append(Spacer(1, 0.1 * inch))
+    def _render(self, target: Union[str, BinaryIO]) -> None:
+        if self.engine == "auto":
+            paragraphs = pdf_canvas.layout(self.document, self.styles, self.tracer)
+            if paragraphs is not None:
+                with tracing.span(self.tracer, "pdf", "draw"):
+                    pdf_canvas.draw(paragraphs, target)
+                return
+        
+        doc = SimpleDocTemplate(
+            target,
+            pagesize=PAGE_SIZE,
+            leftMargin=MARGIN,
+            rightMargin=MARGIN,
+            topMargin=MARGIN,
+            bottomMargin=MARGIN,
+        )
+        
+        story = self.story()
+        with tracing.span(self.tracer, "pdf", "doc.build"):
+            doc.build(story)
     
-    def _build_certifications(self, story: list) -> None:
-        """Add certifications section."""
-        if not self.resume.certifications:
-            return
-        
-        story.append(Paragraph("CERTIFICATION", self.styles['SectionTitle']))
-        
-        for cert in self.resume.certifications:
-            cert_text = f"{cert.name} – {cert.organization} – {cert.year}"
-            story.append(Paragraph(cert_text, self.styles['Normal']))
-            story.append(Spacer(1, 4))
-        
-        story.append(Spacer(1, 0.1 * inch))
+    def story(self) -> list:
+        """Platypus flowables of the resume: header, then each non-empty section."""
+        story = []
+        with tracing.span(self.tracer, "pdf", "_build_header"):
+            self._build_header(story, self.document.header)
+        for section in self.document.sections:
+            if section.blocks:
+                with tracing.span(self.tracer, "pdf", "_build_section", section=section.title):
+                    self._build_section(story, section)
+        return story
     
-    def _build_experiences(self, story: list) -> None:
-        """Add experience section."""
-        if not self.resume.experiences:
-            return
-        
-        story.append(Paragraph("EXPERIENCES PROFESSIONNELLES", self.styles['SectionTitle']))
-        
-        for exp in self.resume.experiences:
-            dates_range = f"{exp.start_date} – {exp.end_date}"
-            exp_header = f"{exp.position} – {exp.company} – {exp.city} – {dates_range}"
-            
-            job_story = [Paragraph(exp_header, self.styles['Normal'])]
-            
-            for bullet in exp.bullets:
-                job_story.append(Paragraph(f"• {bullet}", self.styles['CustomBullet']))
-            
-            story.append(KeepTogether(job_story))
-            story.append(Spacer(1, 6))
-        
-        story.append(Spacer(1, 0.1 * inch))
+    def _build_header(self, story: list, header: Header) -> None:
+        """Add resume header with contact information."""
+        story.append(Paragraph(header.name, self.styles['HeaderName']))
+        if header.contact:
+            story.append(Paragraph(header.contact, self.styles['ContactInfo']))
+        story.append(Spacer(1, HEADER_GAP))
     
-    def _build_skills(self, story: list) -> None:
-        """Add skills section."""
-        has_skills = self.resume.skills_hard or self.resume.skills_soft
-        if not has_skills:
-            return
-        
-        story.append(Paragraph("COMPETENCES", self.styles['SectionTitle']))
-        
-        if self.resume.skills_hard:
-            skills_text = "<b>Competences Techniques:</b><br/>"
-            skills_text += "<br/>".join([f"• {skill}" for skill in self.resume.skills_hard])
-            story.append(Paragraph(skills_text, self.styles['Normal']))
-            story.append(Spacer(1, 12))
-        
-        if self.resume.skills_soft:
-            skills_text = "<b>Competences Comportementales:</b><br/>"
-            skills_text += "<br/>".join([f"• {skill}" for skill in self.resume.skills_soft])
-            story.append(Paragraph(skills_text, self.styles['Normal']))
-            story.append(Spacer(1, 0.1 * inch))
+    def _build_section(self, story: list, section: Section) -> None:
+        """Add a section title and its blocks."""
+        story.append(Paragraph(section.title, self.styles['SectionTitle']))
+        
+        previous = None
+        for block in section.blocks:
+            if isinstance(block, TextBlock):
+                story.append(Paragraph(block.text, self.styles['Normal']))
+            elif isinstance(block, ItemBlock):
+                story.append(Paragraph(block.text, self.styles['Normal']))
+                story.append(Spacer(1, ITEM_GAP))
+            elif isinstance(block, EntryBlock):
+                # Keep each job's heading with its bullets
+                job_story = [Paragraph(block.heading, self.styles['Normal'])]
+                for bullet in block.bullets:
+                    job_story.append(Paragraph(f"• {bullet}", self.styles['CustomBullet']))
+                story.append(KeepTogether(job_story))
+                story.append(Spacer(1, ENTRY_GAP))
+            elif isinstance(block, ListBlock):
+                if isinstance(previous, ListBlock):
+                    story.append(Spacer(1, LIST_GAP))
+                items = "<br/>".join([f"• {item}" for item in block.items])
+                story.append(Paragraph(f"<b>{block.label}:</b><br/>{items}", self.styles['Normal']))
+            previous = block
+        
+        story.append(Spacer(1, SECTION_GAP))
@@ -0,0 +1,115 @@
+"""
+Font-metric cache for CV-Forge.
+String widths and wrapped lines are memoized once per process, so text
+repeated across resumes (section titles, bullets, skills, company names)
+is only measured the first time it is laid out. The direct-canvas engine
+uses them directly; platypus only does after an explicit install(), which
+the batch and render-server worker processes make at start-up.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import paragraph as _paragraph
+from reportlab.platypus.paragraph import split
+
+
+# Bounds on the number of memoized entries (least recently used are dropped)
+WIDTH_CACHE_SIZE = 65536
+WRAP_CACHE_SIZE = 8192
+
+# reportlab's stringWidth replaced by install(), restored by uninstall()
+_replaced = None
+
+# Same tolerance as reportlab's paragraph wrapping
+SPACE_SHRINKAGE = 0.05
+
+
+class Unwrappable(Exception):
+    """A word is wider than the line; only platypus knows how to split it."""
+
+
+@lru_cache(maxsize=WIDTH_CACHE_SIZE)
+def string_width(text: str, font_name: str, font_size: float, encoding: str = "utf8") -> float:
+    """Width of text in points, as reportlab's stringWidth() measures it."""
+    return stringWidth(text, font_name, font_size, encoding)
+
+
+@lru_cache(maxsize=WRAP_CACHE_SIZE)
+def wrap_lines(text: str, font_name: str, font_size: float, max_width: float, mixed: bool) -> Tuple[Tuple[float, str], ...]:
+    """
+    Greedy line breaking as done by Paragraph.breakLines.
+    
+    Returns (unused width, text) per line. mixed selects the rule used for
+    paragraphs made of several fragments (bold label plus <br/> lines),
+    which allow a little less space shrinkage than single-fragment ones.
+    Raises Unwrappable when a single word does not fit on a line.
+    """
+    space_width = string_width(" ", font_name, font_size)
+    lines = []
+    line: List[str] = []
+    width = -space_width
+    for word in split(text):
+        word_width = string_width(word, font_name, font_size)
+        if word_width > max_width:
+            raise Unwrappable(word)
+        new_width = width + space_width + word_width
+        if mixed:
+            limit = max_width + (SPACE_SHRINKAGE * space_width if line else 0)
+        else:
+            limit = max_width + SPACE_SHRINKAGE * space_width * len(line)
+        if line and new_width > limit:
+            lines.append((max_width - width, " ".join(line)))
+            line = [word]
+            width = word_width
+        else:
+            line.append(word)
+            width = new_width
+    if line:
+        lines.append((max_width - width, " ".join(line)))
+    return tuple(lines)
+
+
+def install() -> None:
+    """
+    Opt in to making platypus paragraphs measure text through
+    string_width(). This affects every reportlab user in the process, so
+    only call it from a process that renders nothing but resumes (e.g. a
+    batch worker); the output is unchanged since widths are only memoized.
+    Idempotent; undone by uninstall().
+    """
+    global _replaced
+    if _paragraph.stringWidth is not string_width:
+        _replaced = _paragraph.stringWidth
+        _paragraph.stringWidth = string_width
+
+
+def uninstall() -> None:
+    """Give platypus back the stringWidth it used before install()."""
+    global _replaced
+    if _paragraph.stringWidth is string_width:
+        _paragraph.stringWidth = _replaced
+        _replaced = None
+
+
+def cache_stats() -> Dict[str, dict]:
+    """Hits, misses, size and hit rate of both caches since the last clear."""
+    stats = {}
+    for name, cached in (("widths", string_width), ("wraps", wrap_lines)):
+        info = cached.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+        }
+    return stats
+
+
+def clear() -> None:
+    """Drop every memoized width and wrap (e.g. after re-registering a font)."""
+    string_width.cache_clear()
+    wrap_lines.cache_clear()
@@ -0,0 +1,109 @@
+"""
+PDF style registry for CV-Forge.
+Paragraph styles are built once per process for each (theme, font)
+pair and shared read-only by every PDFExporter.
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+
+
+DEFAULT_THEME = "classic"
+DEFAULT_FONT = "Helvetica"
+
+# Page layout shared by every PDF engine
+PAGE_SIZE = A4
+MARGIN = 0.75 * inch
+
+# Vertical gaps between blocks (points)
+HEADER_GAP = 0.15 * inch
+ITEM_GAP = 4
+ENTRY_GAP = 6
+LIST_GAP = 12
+SECTION_GAP = 0.1 * inch
+
+# Font sizes per theme (points)
+THEMES = {
+    "classic": {
+        "body": 11,
+        "section_title": 12,
+        "header_name": 16,
+        "contact": 10,
+    },
+}
+
+
+def build_styles(theme: str = DEFAULT_THEME, font_name: str = DEFAULT_FONT) -> Mapping[str, ParagraphStyle]:
+    """Build a fresh, uncached set of ATS-compatible paragraph styles."""
+    if theme not in THEMES:
+        raise ValueError(f"Thème inconnu: {theme}")
+    sizes = THEMES[theme]
+    
+    styles = getSampleStyleSheet()
+    
+    # Normal text style
+    styles['Normal'].fontName = font_name
+    styles['Normal'].fontSize = sizes["body"]
+    
+    # Section title style
+    styles.add(ParagraphStyle(
+        name='SectionTitle',
+        parent=styles['Heading2'],
+        fontName=font_name,
+        fontSize=sizes["section_title"],
+        textColor=colors.black,
+        spaceBefore=12,
+        spaceAfter=6,
+        textTransform='uppercase',
+    ))
+    
+    # Header name style
+    styles.add(ParagraphStyle(
+        name='HeaderName',
+        parent=styles['Heading1'],
+        fontName=font_name,
+        fontSize=sizes["header_name"],
+        alignment=1,  # Center
+        spaceAfter=6,
+    ))
+    
+    # Contact info style
+    styles.add(ParagraphStyle(
+        name='ContactInfo',
+        parent=styles['Normal'],
+        fontName=font_name,
+        fontSize=sizes["contact"],
+        alignment=1,  # Center
+        spaceAfter=12,
+    ))
+    
+    # Bullet style
+    styles.add(ParagraphStyle(
+        name='CustomBullet',
+        parent=styles['Normal'],
+        fontName=font_name,
+        fontSize=sizes["body"],
+        leftIndent=20,
+        spaceAfter=3,
+    ))
+    
+    return MappingProxyType(styles.byName)
+
+
+def get_styles(theme: str = DEFAULT_THEME, font_name: str = DEFAULT_FONT) -> Mapping[str, ParagraphStyle]:
+    """
+    Shared styles for a (theme, font) pair, built on first use.
+    The mapping is read-only; callers must not mutate the styles either.
+    """
+    return _cached_styles(theme, font_name)
+
+
+@lru_cache(maxsize=None)
+def _cached_styles(theme: str, font_name: str) -> Mapping[str, ParagraphStyle]:
+    return build_styles(theme, font_name)
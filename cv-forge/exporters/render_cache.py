@@ -0,0 +1,149 @@
+"""
+Render cache for CV-Forge.
+Rendered documents are stored under a hash of the resume content and
+exporter version, so unchanged resumes are copied instead of re-rendered.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from models.resume import Resume
+
+
+class RenderCache:
+    """
+    Size-bounded, content-addressed cache of rendered documents.
+    
+    The cache directory is the index: one file per entry, named after its
+    key, with the file mtime used as last-access time for LRU eviction.
+    Several processes can safely share the same directory.
+    """
+    
+    def __init__(self, directory: Path, max_bytes: int = 512 * 1024 * 1024, link: bool = False):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.link = link
+        self.hits = 0
+        self.misses = 0
+        self._approx_bytes: Optional[int] = None
+    
+    @staticmethod
+    def key_for(resume: Resume, fmt: str, version: str) -> str:
+        """Stable hash of the canonical resume content, format and exporter version."""
+        canonical = json.dumps(resume.to_dict(), sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        digest = hashlib.sha256()
+        digest.update(f"{fmt}\0{version}\0".encode("utf-8"))
+        digest.update(canonical.encode("utf-8"))
+        return digest.hexdigest()
+    
+    def fetch(self, key: str, filepath: str) -> bool:
+        """
+        Copy (or hard-link) a cached artifact to filepath.
+        Returns False on a miss or if the cached file can't be used.
+        """
+        cached = self._path_for(key)
+        if not cached.exists():
+            self.misses += 1
+            return False
+        
+        try:
+            if self.link:
+                if os.path.exists(filepath):
+                    os.remove(filepath)
+                try:
+                    os.link(cached, filepath)
+                except OSError:
+                    shutil.copyfile(cached, filepath)
+            else:
+                shutil.copyfile(cached, filepath)
+            os.utime(cached)  # Mark as recently used
+        except OSError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+    
+    def render_cached(self, key: str, filepath: str, render: Callable[[], None]) -> None:
+        """Serve filepath from the cache, or call render() and cache its output."""
+        if self.fetch(key, filepath):
+            return
+        if self.link and os.path.lexists(filepath):
+            # Never write through a hard link into a cached entry
+            os.remove(filepath)
+        render()
+        self.store(key, filepath)
+    
+    def store(self, key: str, filepath: str) -> None:
+        """Add a freshly rendered file to the cache. Failures are ignored."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+            os.close(fd)
+            try:
+                shutil.copyfile(filepath, tmp_path)
+                os.replace(tmp_path, self._path_for(key))
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except OSError:
+            return
+        
+        if self._approx_bytes is None:
+            self._approx_bytes = self._total_bytes()
+        else:
+            self._approx_bytes += os.path.getsize(filepath)
+        if self._approx_bytes > self.max_bytes:
+            self.evict()
+    
+    def evict(self) -> None:
+        """Drop least recently used entries until the cache is under 90% of its budget."""
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._approx_bytes = total
+    
+    def invalidate(self, key: str) -> None:
+        """Remove a single entry."""
+        try:
+            os.remove(self._path_for(key))
+        except FileNotFoundError:
+            pass
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        if self.directory.exists():
+            for entry in os.scandir(self.directory):
+                if entry.is_file():
+                    os.remove(entry.path)
+        self._approx_bytes = 0
+    
+    def _path_for(self, key: str) -> Path:
+        return self.directory / key
+    
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of every cached entry."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.startswith("."):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue  # Evicted meanwhile by another process
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+    
+    def _total_bytes(self) -> int:
+        return sum(size for _, size, _ in self._scan())
@@ -0,0 +1,66 @@
+"""
+Plain-text Exporter for CV-Forge.
+Writes the same text layout as the live preview, UTF-8 encoded.
+"""
+
+import io
+from typing import BinaryIO, Optional, Union
+
+from models.document import ResumeDocument, build_document
+from models.plain_text import render_document
+from models.resume import Resume
+from exporters.errors import guarded
+from exporters.render_cache import RenderCache
+
+
+class TextExporter:
+    """Export Resume to plain text (.txt)."""
+    
+    # Bump whenever the rendered output changes (invalidates cached renders)
+    FORMAT_VERSION = "1"
+    
+    def __init__(
+        self,
+        resume: Resume,
+        cache: Optional[RenderCache] = None,
+        document: Optional[ResumeDocument] = None,
+    ):
+        self.resume = resume
+        self.cache = cache
+        self._document = document
+    
+    @property
+    def document(self) -> ResumeDocument:
+        """Document tree of the resume; pass it in to share it between exporters."""
+        if self._document is None:
+            self._document = build_document(self.resume)
+        return self._document
+    
+    def export(self, filepath: str) -> None:
+        """Export the resume to a text file."""
+        def render():
+            if self.cache is None:
+                self._render(filepath)
+            else:
+                key = self.cache.key_for(self.resume, "txt", self.FORMAT_VERSION)
+                self.cache.render_cached(key, filepath, lambda: self._render(filepath))
+        
+        guarded(render, filepath, "du texte")
+    
+    def export_to_stream(self, fileobj: BinaryIO) -> None:
+        """Write the text to a writable binary file object (left open)."""
+        guarded(lambda: self._render(fileobj), getattr(fileobj, "name", "<flux>"), "du texte")
+    
+    def export_to_bytes(self) -> bytes:
+        """Render the text in memory and return its UTF-8 content."""
+        buffer = io.BytesIO()
+        self.export_to_stream(buffer)
+        return buffer.getvalue()
+    
+    def _render(self, target: Union[str, BinaryIO]) -> None:
+        content = render_document(self.document).encode("utf-8")
+        if isinstance(target, str):
+            with open(target, "wb") as f:
+                f.write(content)
+        else:
+            target.write(content)
@@ -0,0 +1,142 @@
+"""
+Export instrumentation for CV-Forge.
+A Tracer passed to an exporter records the wall time and memory allocated
+by each rendering step (header, each section, final build or save), as
+records, through a callback, or as a Chrome trace (chrome://tracing,
+Perfetto). Without a tracer the exporters only pay for a None check.
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import Callable, ContextManager, Dict, List, Optional
+
+
+@dataclass
+class SpanRecord:
+    """One timed rendering step."""
+    category: str
+    name: str
+    start_ms: float
+    duration_ms: float
+    thread_id: int
+    # Net bytes still allocated at the end of the step, and the peak above
+    # its starting point (None when memory tracing is off)
+    allocated_bytes: Optional[int] = None
+    peak_bytes: Optional[int] = None
+    args: Dict[str, str] = field(default_factory=dict)
+
+
+class Tracer:
+    """
+    Collects SpanRecords from the exporters it is passed to.
+    
+    memory=True measures allocations with tracemalloc, which is started
+    for the lifetime of the tracer if it was not already running and slows
+    rendering down noticeably; the timings stay comparable between steps.
+    tracemalloc is process-wide: steps of exports running concurrently on
+    other threads count towards each other's allocations. Steps are not
+    nested, so each one resets the allocation peak.
+    """
+    
+    def __init__(self, on_record: Optional[Callable[[SpanRecord], None]] = None, memory: bool = True):
+        self.on_record = on_record
+        self.memory = memory
+        self.records: List[SpanRecord] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._owns_tracemalloc = memory and not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start()
+    
+    def close(self) -> None:
+        """Stop tracemalloc if this tracer started it."""
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+    
+    def __enter__(self) -> "Tracer":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    @contextmanager
+    def span(self, category: str, name: str, **args: str):
+        """Time the enclosed block and record it, even if it raises."""
+        memory = self.memory and tracemalloc.is_tracing()
+        if memory:
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            record = SpanRecord(
+                category,
+                name,
+                (start - self._origin) * 1000,
+                (end - start) * 1000,
+                threading.get_ident(),
+                args=args,
+            )
+            if memory:
+                current, peak = tracemalloc.get_traced_memory()
+                record.allocated_bytes = current - start_bytes
+                record.peak_bytes = peak - start_bytes
+            with self._lock:
+                self.records.append(record)
+            if self.on_record:
+                self.on_record(record)
+    
+    def totals(self) -> Dict[str, float]:
+        """Total milliseconds per "category.name", slowest first."""
+        totals: Dict[str, float] = {}
+        for record in self.records:
+            key = f"{record.category}.{record.name}"
+            totals[key] = totals.get(key, 0.0) + record.duration_ms
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+    
+    def chrome_trace(self) -> dict:
+        """Records in the Trace Event Format (complete events, microseconds)."""
+        pid = os.getpid()
+        events = []
+        for record in self.records:
+            args = dict(record.args)
+            if record.allocated_bytes is not None:
+                args["allocated_bytes"] = record.allocated_bytes
+                args["peak_bytes"] = record.peak_bytes
+            events.append({
+                "name": record.name,
+                "cat": record.category,
+                "ph": "X",
+                "ts": record.start_ms * 1000,
+                "dur": record.duration_ms * 1000,
+                "pid": pid,
+                "tid": record.thread_id,
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+    
+    def write_chrome_trace(self, filepath: str) -> None:
+        """Write chrome_trace() as JSON, loadable in chrome://tracing or Perfetto."""
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f, ensure_ascii=False)
+    
+    def to_dicts(self) -> List[dict]:
+        return [asdict(record) for record in self.records]
+
+
+_DISABLED = nullcontext()
+
+
+def span(tracer: Optional[Tracer], category: str, name: str, **args: str) -> ContextManager:
+    """tracer.span(...), or a shared no-op context when tracing is off."""
+    if tracer is None:
+        return _DISABLED
+    return tracer.span(category, name, **args)
@@ -7,23 +7,193 @@ A desktop application for creating ATS-compatible resumes.
 
 Usage:
     python main.py
+    python main.py --measure-startup
+    python main.py export --all --formats pdf,docx --jobs 4 --output out/
+    python main.py export --all --book shortlist.pdf
+    python main.py serve --port 8080 --workers 4
 """
 
-import customtkinter as ctk
+import time
+
+STARTUP_TIME = time.perf_counter()
+
+import argparse
 import sys
 from pathlib import Path
 
 # Add cv-forge directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from ui.main_window import MainWindow
 
-
-def main():
+def run_gui(measure_startup: bool = False):
     """Launch the CV-Forge application."""
+    from ui.main_window import MainWindow
+    
     app = MainWindow()
+    
+    if measure_startup:
+        # Print the time to the first main loop iteration and quit
+        def report():
+            elapsed_ms = (time.perf_counter() - STARTUP_TIME) * 1000
+            print(f"startup_ms={elapsed_ms:.1f}", flush=True)
+            app.destroy()
+        
+        app.after_idle(report)
+    
     app.mainloop()
 
 
+def run_export(args) -> int:
+    """Render stored profiles without the GUI. Returns the exit code."""
+    from exporters.batch import export_profiles
+    from storage.repository import open_default_repository, open_repository
+    
+    try:
+        if args.profiles:
+            repository = open_repository(args.profiles)
+        else:
+            repository = open_default_repository()
+        
+        if args.book:
+            return run_export_book(args, repository)
+        
+        try:
+            if args.all:
+                profiles = repository.load_all()
+            else:
+                missing = [name for name in args.profile if name not in repository]
+                if missing:
+                    print(f"✗ Profil(s) introuvable(s): {', '.join(missing)}", file=sys.stderr)
+                    return 2
+                profiles = {name: repository.load(name) for name in args.profile}
+        finally:
+            repository.close()
+    except Exception as e:
+        print(f"✗ Impossible de lire les profils: {e}", file=sys.stderr)
+        return 2
+    
+    formats = [fmt.strip().lower() for fmt in args.formats.split(",") if fmt.strip()]
+    
+    if args.clear_cache and args.cache_dir:
+        from exporters.render_cache import RenderCache
+        RenderCache(args.cache_dir).clear()
+    
+    def report(result):
+        if result.ok:
+            print(f"✓ {result.filepath}" + (" (cache)" if result.cached else ""))
+        else:
+            print(f"✗ {result.profile} ({result.fmt}): {result.error}", file=sys.stderr)
+    
+    try:
+        results = export_profiles(
+            profiles,
+            args.output,
+            formats,
+            args.jobs,
+            on_result=report,
+            cache_dir=args.cache_dir,
+            cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+        )
+    except ValueError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 2
+    
+    failures = sum(1 for result in results if not result.ok)
+    cached = sum(1 for result in results if result.cached)
+    print(f"{len(results) - failures}/{len(results)} fichier(s) exporté(s), dont {cached} depuis le cache")
+    return 1 if failures else 0
+
+
+def run_export_book(args, repository) -> int:
+    """Render the selected profiles into one PDF, loading them one at a time."""
+    from exporters.pdf_book import PDFBookExporter
+    from models.resume import Resume
+    
+    try:
+        names = repository.names() if args.all else args.profile
+        missing = [name for name in names if name not in repository]
+        if missing:
+            print(f"✗ Profil(s) introuvable(s): {', '.join(missing)}", file=sys.stderr)
+            return 2
+        
+        book = PDFBookExporter(Resume.from_dict(repository.load(name)) for name in names)
+        args.book.parent.mkdir(parents=True, exist_ok=True)
+        book.export(str(args.book))
+    except Exception as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return 1
+    finally:
+        repository.close()
+    
+    print(f"✓ {args.book} ({book.count} CV)")
+    return 0
+
+
+def run_serve(args) -> int:
+    """Run the HTTP render service. Returns the exit code."""
+    from server.render_server import serve
+    
+    try:
+        serve(args.host, args.port, args.workers, args.queue, args.timeout)
+    except OSError as e:
+        print(f"✗ Impossible de démarrer le serveur: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="CV-Forge - Générateur de CV ATS")
+    parser.add_argument(
+        "--measure-startup",
+        action="store_true",
+        help="Afficher le temps de démarrage jusqu'à la première itération de la boucle Tk, puis quitter",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    
+    export_parser = subparsers.add_parser("export", help="Exporter des profils sans interface graphique")
+    selection = export_parser.add_mutually_exclusive_group(required=True)
+    selection.add_argument("--all", action="store_true", help="Exporter tous les profils")
+    selection.add_argument("--profile", action="append", metavar="NOM", help="Profil à exporter (répétable)")
+    export_parser.add_argument("--formats", default="pdf,docx", help="Formats séparés par des virgules (pdf,docx,txt)")
+    export_parser.add_argument("--jobs", type=int, default=None, help="Nombre de processus (défaut: nombre de CPU)")
+    export_parser.add_argument("--output", type=Path, default=Path("exports"), help="Dossier de sortie")
+    export_parser.add_argument(
+        "--book",
+        type=Path,
+        default=None,
+        metavar="FICHIER",
+        help="Réunir les profils dans un seul PDF (un CV par section, avec signets)",
+    )
+    export_parser.add_argument(
+        "--profiles",
+        type=Path,
+        default=None,
+        help="Base de profils: fichier .db, fichier .json ou dossier (défaut: data/profiles.db)",
+    )
+    export_parser.add_argument("--cache-dir", type=Path, default=None, help="Cache des rendus (CV inchangés copiés)")
+    export_parser.add_argument("--cache-max-mb", type=int, default=512, help="Taille maximale du cache en Mo")
+    export_parser.add_argument("--clear-cache", action="store_true", help="Vider le cache avant l'export")
+    
+    serve_parser = subparsers.add_parser("serve", help="Servir le rendu PDF/DOCX en HTTP")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Adresse d'écoute")
+    serve_parser.add_argument("--port", type=int, default=8080, help="Port d'écoute")
+    serve_parser.add_argument("--workers", type=int, default=None, help="Processus de rendu (défaut: nombre de CPU)")
+    serve_parser.add_argument("--queue", type=int, default=None, help="Requêtes en attente acceptées (défaut: 2 par processus)")
+    serve_parser.add_argument("--timeout", type=float, default=30.0, help="Délai maximal par requête en secondes")
+    
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    
+    if args.command == "export":
+        sys.exit(run_export(args))
+    if args.command == "serve":
+        sys.exit(run_serve(args))
+    
+    run_gui(measure_startup=args.measure_startup)
+
+
 if __name__ == "__main__":
     main()
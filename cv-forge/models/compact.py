@@ -0,0 +1,162 @@
+"""
+Compact resume model for CV-Forge.
+Memory-lean, read-mostly counterpart of models.resume for holding many
+profiles at once (batch jobs, the render server, search).
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Tuple
+
+from models.resume import Resume
+
+
+def _intern(value):
+    """
+    Share one copy of values that repeat across profiles (cities, companies, skills...).
+    Non-string values from old JSON (e.g. a numeric year) are kept as they are,
+    like Resume.from_dict keeps them.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
+class CompactEducation:
+    """Slotted Education; every field is interned."""
+    diploma: str = ""
+    institution: str = ""
+    dates: str = ""
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompactEducation":
+        return cls(
+            _intern(data.get("diploma", "")),
+            _intern(data.get("institution", "")),
+            _intern(data.get("dates", "")),
+        )
+    
+    def to_dict(self) -> dict:
+        return {"diploma": self.diploma, "institution": self.institution, "dates": self.dates}
+
+
+@dataclass(slots=True)
+class CompactCertification:
+    """Slotted Certification; every field is interned."""
+    name: str = ""
+    organization: str = ""
+    year: str = ""
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompactCertification":
+        return cls(
+            _intern(data.get("name", "")),
+            _intern(data.get("organization", "")),
+            _intern(data.get("year", "")),
+        )
+    
+    def to_dict(self) -> dict:
+        return {"name": self.name, "organization": self.organization, "year": self.year}
+
+
+@dataclass(slots=True)
+class CompactExperience:
+    """Slotted Experience with a tuple of bullets; bullets are not interned."""
+    position: str = ""
+    company: str = ""
+    city: str = ""
+    start_date: str = ""
+    end_date: str = ""
+    bullets: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompactExperience":
+        return cls(
+            _intern(data.get("position", "")),
+            _intern(data.get("company", "")),
+            _intern(data.get("city", "")),
+            _intern(data.get("start_date", "")),
+            _intern(data.get("end_date", "")),
+            tuple(data.get("bullets", ())),
+        )
+    
+    def to_dict(self) -> dict:
+        return {
+            "position": self.position,
+            "company": self.company,
+            "city": self.city,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "bullets": list(self.bullets),
+        }
+
+
+@dataclass(slots=True)
+class CompactResume:
+    """
+    Slotted Resume with tuple-backed sections and interned repeated values.
+    
+    to_dict() and from_dict() are interchangeable with Resume's, and the
+    attributes read by the exporters are the same, so a CompactResume can
+    be rendered directly. Sections are tuples: build a new instance (or
+    use to_resume()) to edit.
+    """
+    first_name: str = ""
+    last_name: str = ""
+    phone: str = ""
+    email: str = ""
+    linkedin: str = ""
+    address: str = ""
+    profile: str = ""
+    education: Tuple[CompactEducation, ...] = ()
+    certifications: Tuple[CompactCertification, ...] = ()
+    experiences: Tuple[CompactExperience, ...] = ()
+    skills_hard: Tuple[str, ...] = ()
+    skills_soft: Tuple[str, ...] = ()
+    
+    @property
+    def full_name(self) -> str:
+        """Return full name in uppercase format (ATS-friendly)."""
+        return f"{self.first_name.strip()} {self.last_name.strip()}".upper()
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompactResume":
+        """Create a CompactResume from a Resume.to_dict() payload."""
+        return cls(
+            first_name=_intern(data.get("first_name", "")),
+            last_name=_intern(data.get("last_name", "")),
+            phone=data.get("phone", ""),
+            email=data.get("email", ""),
+            linkedin=data.get("linkedin", ""),
+            address=_intern(data.get("address", "")),
+            profile=data.get("profile", ""),
+            education=tuple(CompactEducation.from_dict(edu) for edu in data.get("education", ())),
+            certifications=tuple(CompactCertification.from_dict(cert) for cert in data.get("certifications", ())),
+            experiences=tuple(CompactExperience.from_dict(exp) for exp in data.get("experiences", ())),
+            skills_hard=tuple(_intern(skill) for skill in data.get("skills_hard", ())),
+            skills_soft=tuple(_intern(skill) for skill in data.get("skills_soft", ())),
+        )
+    
+    @classmethod
+    def from_resume(cls, resume: Resume) -> "CompactResume":
+        return cls.from_dict(resume.to_dict())
+    
+    def to_dict(self) -> dict:
+        """Same payload as Resume.to_dict()."""
+        return {
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "phone": self.phone,
+            "email": self.email,
+            "linkedin": self.linkedin,
+            "address": self.address,
+            "profile": self.profile,
+            "education": [edu.to_dict() for edu in self.education],
+            "certifications": [cert.to_dict() for cert in self.certifications],
+            "experiences": [exp.to_dict() for exp in self.experiences],
+            "skills_hard": list(self.skills_hard),
+            "skills_soft": list(self.skills_soft),
+        }
+    
+    def to_resume(self) -> Resume:
+        """Editable Resume with the same content."""
+        return Resume.from_dict(self.to_dict())
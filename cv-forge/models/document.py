@@ -0,0 +1,145 @@
+"""
+Document tree for CV-Forge.
+Format-neutral layout of a resume: the section titles and the text of
+every line, assembled once and shared by the PDF, DOCX and preview
+renderers.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+from models.resume import Resume
+
+
+CONTACT_SEPARATOR = " | "
+FIELD_SEPARATOR = " – "
+
+
+@dataclass(frozen=True, slots=True)
+class Header:
+    """Name line and the joined contact line ("" when there is none)."""
+    name: str
+    contact: str
+
+
+@dataclass(frozen=True, slots=True)
+class TextBlock:
+    """Free text (the profile summary)."""
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class ItemBlock:
+    """One-line entry (a diploma, a certification)."""
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class EntryBlock:
+    """Heading line followed by bullet points (an experience)."""
+    heading: str
+    bullets: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ListBlock:
+    """Labelled list (a group of skills)."""
+    label: str
+    items: Tuple[str, ...]
+
+
+Block = Union[TextBlock, ItemBlock, EntryBlock, ListBlock]
+
+
+@dataclass(frozen=True, slots=True)
+class Section:
+    """Titled section; renderers skip sections without blocks."""
+    key: str
+    title: str
+    blocks: Tuple[Block, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeDocument:
+    """
+    Header plus every section in display order, empty ones included, so
+    the section list is the same for every resume. Nodes are immutable
+    and compare by value, which lets the preview detect changed sections.
+    """
+    header: Header
+    sections: Tuple[Section, ...]
+    
+    def section(self, key: str) -> Section:
+        for section in self.sections:
+            if section.key == key:
+                return section
+        raise ValueError(f"Section inconnue: {key}")
+
+
+def _header(resume: Resume) -> Header:
+    contact = [value for value in (resume.phone, resume.email, resume.linkedin, resume.address) if value]
+    return Header(resume.full_name, CONTACT_SEPARATOR.join(contact))
+
+
+def _fields(*values) -> str:
+    """Join entry fields; profiles loaded from JSON may hold numbers (a year)."""
+    return FIELD_SEPARATOR.join(str(value) for value in values)
+
+
+def _texts(values) -> Tuple[str, ...]:
+    return tuple(str(value) for value in values)
+
+
+def _profile(resume: Resume) -> Tuple[Block, ...]:
+    return (TextBlock(resume.profile),) if resume.profile else ()
+
+
+def _education(resume: Resume) -> Tuple[Block, ...]:
+    return tuple(
+        ItemBlock(_fields(edu.diploma, edu.institution, edu.dates))
+        for edu in resume.education
+    )
+
+
+def _certifications(resume: Resume) -> Tuple[Block, ...]:
+    return tuple(
+        ItemBlock(_fields(cert.name, cert.organization, cert.year))
+        for cert in resume.certifications
+    )
+
+
+def _experiences(resume: Resume) -> Tuple[Block, ...]:
+    return tuple(
+        EntryBlock(
+            _fields(exp.position, exp.company, exp.city, exp.start_date, exp.end_date),
+            _texts(exp.bullets),
+        )
+        for exp in resume.experiences
+    )
+
+
+def _skills(resume: Resume) -> Tuple[Block, ...]:
+    blocks = []
+    if resume.skills_hard:
+        blocks.append(ListBlock("Competences Techniques", _texts(resume.skills_hard)))
+    if resume.skills_soft:
+        blocks.append(ListBlock("Competences Comportementales", _texts(resume.skills_soft)))
+    return tuple(blocks)
+
+
+# Body sections in display order: (key, title, block builder)
+SECTIONS = (
+    ("profile", "PROFIL", _profile),
+    ("education", "FORMATION", _education),
+    ("certifications", "CERTIFICATION", _certifications),
+    ("experiences", "EXPERIENCES PROFESSIONNELLES", _experiences),
+    ("skills", "COMPETENCES", _skills),
+)
+
+
+def build_document(resume: Resume) -> ResumeDocument:
+    """Assemble the document tree of a Resume (or CompactResume)."""
+    return ResumeDocument(
+        _header(resume),
+        tuple(Section(key, title, blocks(resume)) for key, title, blocks in SECTIONS),
+    )
@@ -0,0 +1,53 @@
+"""
+Plain-text layout for CV-Forge.
+Renders document tree nodes as the fixed-width text shown in the live
+preview and written by the .txt exporter.
+"""
+
+from typing import List, Union
+
+from models.document import EntryBlock, Header, ItemBlock, ListBlock, ResumeDocument, Section, TextBlock
+
+
+WIDTH = 60
+
+
+def _header_lines(header: Header) -> List[str]:
+    lines = ["=" * WIDTH, header.name.center(WIDTH), "=" * WIDTH]
+    if header.contact:
+        lines.append(header.contact.center(WIDTH))
+    lines.append("")
+    return lines
+
+
+def _section_lines(section: Section) -> List[str]:
+    if not section.blocks:
+        return []
+    lines = [section.title, "-" * 40]
+    for block in section.blocks:
+        if isinstance(block, TextBlock):
+            lines.append(block.text)
+        elif isinstance(block, ItemBlock):
+            lines.append(f"  {block.text}")
+        elif isinstance(block, EntryBlock):
+            lines.append(f"  {block.heading}")
+            lines.extend(f"    • {bullet}" for bullet in block.bullets)
+        elif isinstance(block, ListBlock):
+            lines.append(f"  {block.label}:")
+            lines.extend(f"    • {item}" for item in block.items)
+    lines.append("")
+    return lines
+
+
+def _join(lines: List[str]) -> str:
+    return "".join(line + "\n" for line in lines)
+
+
+def render_node(node: Union[Header, Section]) -> str:
+    """Text of the header or of one section (empty for an empty section)."""
+    return _join(_header_lines(node) if isinstance(node, Header) else _section_lines(node))
+
+
+def render_document(document: ResumeDocument) -> str:
+    """Plain-text rendering of a whole document tree."""
+    return render_node(document.header) + "".join(render_node(section) for section in document.sections)
@@ -0,0 +1,290 @@
+"""
+HTTP render service for CV-Forge.
+Accepts a Resume.to_dict() JSON payload and returns the rendered PDF,
+DOCX or text, rendering in a pre-warmed, bounded pool of worker processes.
+"""
+
+import json
+import os
+import re
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+from models.resume import Resume
+from exporters.batch import EXPORTERS, output_filename
+
+
+CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "txt": "text/plain; charset=utf-8",
+}
+
+MAX_BODY_BYTES = 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+class ServiceBusy(Exception):
+    """Every worker is busy and the queue is full."""
+
+
+class ServiceUnavailable(Exception):
+    """The worker pool died; it is restarted for the next request."""
+
+
+def _warm_up_worker() -> None:
+    """
+    Load the exporters and their shared templates once per worker, and
+    let platypus use the cached metrics: workers only render resumes.
+    """
+    from exporters import pdf_metrics
+    from exporters.docx_template import base_document_bytes
+    from exporters.pdf_styles import get_styles
+    
+    pdf_metrics.install()
+    get_styles()
+    base_document_bytes()
+
+
+# Control characters (CR/LF would split the header), quotes and backslashes
+_UNSAFE_FALLBACK = re.compile(r'[\x00-\x1f\x7f"\\?]')
+
+
+def _content_disposition(filename: str) -> str:
+    """Attachment header with an ASCII fallback and the UTF-8 name (RFC 6266)."""
+    fallback = _UNSAFE_FALLBACK.sub("_", filename.encode("ascii", "replace").decode("ascii"))
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename)}"
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _render_document(fmt: str, data: dict) -> bytes:
+    """Render one document in a worker process."""
+    return EXPORTERS[fmt](Resume.from_dict(data)).export_to_bytes()
+
+
+class RenderService:
+    """
+    Bounded render pool shared by the request handler threads.
+    
+    At most workers + queue_size renders are accepted at once; anything
+    beyond that is refused immediately so that clients can back off.
+    A slot is only given back when its render really ends, so renders
+    that outlived their timeout still count against the limit.
+    """
+    
+    def __init__(self, workers: Optional[int] = None, queue_size: Optional[int] = None, timeout: float = 30.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = self.workers * 2 if queue_size is None else queue_size
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._pool = self._start_pool()
+    
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.queue_size
+    
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+    
+    def render(self, fmt: str, data: dict) -> bytes:
+        """
+        Render data to fmt. Raises ServiceBusy when saturated, TimeoutError
+        when the render (queueing included) exceeds the timeout, and the
+        exporter's exception when rendering fails.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise ServiceBusy()
+        
+        try:
+            with self._lock:
+                pool = self._pool
+            future = pool.submit(_render_document, fmt, data)
+        except BrokenProcessPool:
+            self._slots.release()
+            self._restart_pool(pool)
+            raise ServiceUnavailable()
+        except BaseException:
+            self._slots.release()
+            raise
+        
+        with self._lock:
+            self._in_flight += 1
+        future.add_done_callback(self._release)
+        
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()  # Only possible while still queued
+            raise
+        except BrokenProcessPool:
+            self._restart_pool(pool)
+            raise ServiceUnavailable()
+    
+    def close(self) -> None:
+        with self._lock:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _start_pool(self) -> ProcessPoolExecutor:
+        pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_up_worker)
+        # Start every worker now rather than on the first requests
+        for future in [pool.submit(_ping) for _ in range(self.workers)]:
+            future.result()
+        return pool
+    
+    def _restart_pool(self, broken: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is not broken:
+                return  # Already restarted by another request
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._pool = self._start_pool()
+    
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """
+    POST /render/pdf and POST /render/docx with a Resume.to_dict() JSON
+    body; GET /health reports the pool state.
+    """
+    
+    server_version = "CV-Forge"
+    protocol_version = "HTTP/1.1"
+    
+    @property
+    def service(self) -> RenderService:
+        return self.server.service
+    
+    def do_GET(self):
+        if self.path != "/health":
+            self._send_error(HTTPStatus.NOT_FOUND, "Ressource introuvable")
+            return
+        self._send_json(HTTPStatus.OK, {
+            "workers": self.service.workers,
+            "capacity": self.service.capacity,
+            "in_flight": self.service.in_flight,
+        })
+    
+    def do_POST(self):
+        fmt = self._route()
+        if fmt is None:
+            self._send_error(HTTPStatus.NOT_FOUND, "Ressource introuvable")
+            return
+        
+        data, error = self._read_payload()
+        if error:
+            self._send_error(*error)
+            return
+        
+        try:
+            content = self.service.render(fmt, data)
+        except ServiceBusy:
+            self._send_error(
+                HTTPStatus.TOO_MANY_REQUESTS,
+                "Serveur saturé, réessayez plus tard",
+                headers={"Retry-After": "1"},
+            )
+            return
+        except ServiceUnavailable:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, "Processus de rendu indisponible, réessayez")
+            return
+        except TimeoutError:
+            self._send_error(HTTPStatus.GATEWAY_TIMEOUT, "Délai de génération dépassé")
+            return
+        except Exception as e:
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+            return
+        
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", CONTENT_TYPES[fmt])
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("Content-Disposition", _content_disposition(output_filename(data, fmt)))
+        self.end_headers()
+        
+        view = memoryview(content)
+        for start in range(0, len(view), CHUNK_SIZE):
+            self.wfile.write(view[start:start + CHUNK_SIZE])
+    
+    def _route(self) -> Optional[str]:
+        prefix = "/render/"
+        if not self.path.startswith(prefix):
+            return None
+        fmt = self.path[len(prefix):]
+        return fmt if fmt in EXPORTERS else None
+    
+    def _read_payload(self) -> Tuple[Optional[dict], Optional[tuple]]:
+        """Return (resume dict, None) or (None, (status, message))."""
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            return None, (HTTPStatus.LENGTH_REQUIRED, "En-tête Content-Length requis")
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True  # The body is left unread
+            return None, (HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Corps de requête trop volumineux")
+        
+        try:
+            data = json.loads(self.rfile.read(length))
+            if not isinstance(data, dict):
+                raise ValueError("objet JSON attendu")
+            Resume.from_dict(data)  # Reject malformed payloads before using a worker
+        except (ValueError, TypeError) as e:
+            return None, (HTTPStatus.BAD_REQUEST, f"CV invalide: {e}")
+        return data, None
+    
+    def _send_json(self, status: HTTPStatus, payload: dict, headers: Optional[dict] = None) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _send_error(self, status: HTTPStatus, message: str, headers: Optional[dict] = None) -> None:
+        self._send_json(status, {"error": message}, headers)
+
+
+class RenderServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the shared RenderService."""
+    
+    daemon_threads = True
+    
+    def __init__(self, address: Tuple[str, int], service: RenderService):
+        self.service = service
+        super().__init__(address, RenderRequestHandler)
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    workers: Optional[int] = None,
+    queue_size: Optional[int] = None,
+    timeout: float = 30.0,
+) -> None:
+    """Run the render service until interrupted."""
+    service = RenderService(workers, queue_size, timeout)
+    server = RenderServer((host, port), service)
+    print(f"CV-Forge: rendu sur http://{host}:{server.server_port} ({service.workers} processus, file de {service.queue_size})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
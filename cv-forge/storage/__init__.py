@@ -0,0 +1 @@
+# Storage Module
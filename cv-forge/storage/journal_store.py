@@ -0,0 +1,254 @@
+"""
+Append-only journal profile repository for CV-Forge.
+Each save appends one length-prefixed, checksummed record; a background
+compaction rewrites the file once enough records are dead.
+"""
+
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from storage.codecs import decode_profile, get_codec
+from storage.repository import ProfileRepository
+
+
+FILE_MAGIC = b"CVFJ\x01"
+
+# op (1 byte), key length, payload length, crc32 of key + payload
+RECORD_HEADER = struct.Struct(">BHII")
+
+OP_PUT = 1
+OP_DELETE = 2
+
+
+def _encode_record(op: int, key: str, payload: bytes = b"") -> bytes:
+    key_bytes = key.encode("utf-8")
+    crc = zlib.crc32(key_bytes + payload)
+    return RECORD_HEADER.pack(op, len(key_bytes), len(payload), crc) + key_bytes + payload
+
+
+def _iter_records(f: BinaryIO, start: int, end: int) -> Iterator[Tuple[int, str, int, int, int]]:
+    """
+    Yield (op, key, payload_offset, payload_length, record_end) for every
+    valid record between start and end. Stops at the first torn or
+    corrupted record.
+    """
+    offset = start
+    f.seek(offset)
+    while offset + RECORD_HEADER.size <= end:
+        op, key_len, payload_len, crc = RECORD_HEADER.unpack(f.read(RECORD_HEADER.size))
+        record_end = offset + RECORD_HEADER.size + key_len + payload_len
+        if op not in (OP_PUT, OP_DELETE) or record_end > end:
+            return
+        key_bytes = f.read(key_len)
+        payload = f.read(payload_len)
+        if zlib.crc32(key_bytes + payload) != crc:
+            return
+        yield op, key_bytes.decode("utf-8"), offset + RECORD_HEADER.size + key_len, payload_len, record_end
+        offset = record_end
+
+
+class JournalProfileRepository(ProfileRepository):
+    """
+    Profile repository stored as an append-only journal (*.journal).
+    
+    Saves cost O(record size). The key -> offset map is rebuilt once when
+    the file is opened; a torn final write fails its checksum and is
+    truncated away, so only that last record is lost.
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        compact_min_dead: int = 100,
+        compact_ratio: float = 0.5,
+        sync: bool = True,
+        codec: str = "json",
+    ):
+        self.path = Path(path)
+        self.codec = get_codec(codec)
+        self.compact_min_dead = compact_min_dead
+        self.compact_ratio = compact_ratio
+        self.sync = sync
+        
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._compaction: Optional[threading.Thread] = None
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+        self._dead = 0
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a+b")
+        self._replay_file()
+    
+    @property
+    def dead_records(self) -> int:
+        """Number of superseded or deleted records still in the file."""
+        return self._dead
+    
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._offsets)
+    
+    def load(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._offsets.get(key)
+            if entry is None:
+                return None
+            offset, length = entry
+            self._file.seek(offset)
+            payload = self._file.read(length)
+        return decode_profile(payload)
+    
+    def save(self, key: str, data: dict) -> None:
+        self.save_many([(key, data)])
+    
+    def save_many(self, items: Iterable[Tuple[str, dict]]) -> None:
+        """Append one record per profile and sync once."""
+        with self._lock:
+            for key, data in items:
+                self._append(OP_PUT, key, self.codec.encode(data))
+            self._flush()
+        self._maybe_compact()
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key not in self._offsets:
+                return
+            self._append(OP_DELETE, key)
+            self._flush()
+        self._maybe_compact()
+    
+    def compact(self) -> None:
+        """Rewrite the journal so that it only holds live records."""
+        with self._compact_lock:
+            self._compact()
+    
+    def close(self) -> None:
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
+        with self._lock:
+            self._file.close()
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._offsets
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._offsets)
+    
+    def _compact(self) -> None:
+        with self._lock:
+            self._file.flush()
+            snapshot = dict(self._offsets)
+            snapshot_end = self._file.seek(0, os.SEEK_END)
+        
+        # Copy live records without blocking saves
+        tmp_path = self.path.with_name(self.path.name + ".compact")
+        src = open(self.path, "rb")
+        dst = open(tmp_path, "wb")
+        try:
+            dst.write(FILE_MAGIC)
+            offsets = {}
+            for key, (offset, length) in snapshot.items():
+                src.seek(offset)
+                record = _encode_record(OP_PUT, key, src.read(length))
+                offsets[key] = (dst.tell() + len(record) - length, length)
+                dst.write(record)
+            
+            with self._lock:
+                # Carry over records appended while we were copying
+                self._file.flush()
+                end = self._file.seek(0, os.SEEK_END)
+                shift = dst.tell() - snapshot_end
+                tail_end = snapshot_end
+                dead = 0
+                for op, key, payload_offset, length, record_end in _iter_records(src, snapshot_end, end):
+                    if key in offsets:
+                        dead += 1
+                    if op == OP_PUT:
+                        offsets[key] = (payload_offset + shift, length)
+                    else:
+                        offsets.pop(key, None)
+                        dead += 1
+                    tail_end = record_end
+                
+                src.seek(snapshot_end)
+                dst.write(src.read(tail_end - snapshot_end))
+                dst.flush()
+                os.fsync(dst.fileno())
+                src.close()
+                dst.close()
+                
+                self._file.close()
+                os.replace(tmp_path, self.path)
+                self._file = open(self.path, "a+b")
+                self._offsets = offsets
+                self._dead = dead
+        finally:
+            src.close()
+            dst.close()
+            if tmp_path.exists():
+                tmp_path.unlink()
+    
+    def _replay_file(self) -> None:
+        """Rebuild the key -> offset map, dropping a torn tail if any."""
+        f = self._file
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            f.write(FILE_MAGIC)
+            self._flush()
+            return
+        
+        f.seek(0)
+        if f.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            f.close()
+            raise ValueError(f"Fichier journal invalide: {self.path}")
+        
+        valid_end = len(FILE_MAGIC)
+        for op, key, payload_offset, length, record_end in _iter_records(f, valid_end, size):
+            self._apply(op, key, payload_offset, length)
+            valid_end = record_end
+        
+        if valid_end < size:
+            f.truncate(valid_end)
+            self._flush()
+    
+    def _append(self, op: int, key: str, payload: bytes = b"") -> None:
+        record = _encode_record(op, key, payload)
+        offset = self._file.seek(0, os.SEEK_END)
+        self._file.write(record)
+        self._apply(op, key, offset + len(record) - len(payload), len(payload))
+    
+    def _apply(self, op: int, key: str, payload_offset: int, length: int) -> None:
+        if key in self._offsets:
+            self._dead += 1  # Superseded record
+        if op == OP_PUT:
+            self._offsets[key] = (payload_offset, length)
+        else:
+            self._offsets.pop(key, None)
+            self._dead += 1  # The delete record itself
+    
+    def _flush(self) -> None:
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+    
+    def _maybe_compact(self) -> None:
+        with self._lock:
+            total = len(self._offsets) + self._dead
+            if self._dead < self.compact_min_dead or self._dead < self.compact_ratio * total:
+                return
+            if self._compaction is not None and self._compaction.is_alive():
+                return
+            self._compaction = threading.Thread(
+                target=self.compact,
+                name="cv-forge-journal-compaction",
+                daemon=True,
+            )
+            self._compaction.start()
@@ -0,0 +1,256 @@
+"""
+Profile repository abstraction for CV-Forge.
+Every storage backend exposes the same small API so the UI and the
+batch exporter don't care how profiles are stored.
+"""
+
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def atomic_write_json(path: Path, data) -> None:
+    """Write JSON to a temp file and move it into place."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """Write bytes to a temp file and move it into place."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@dataclass(frozen=True)
+class ProfileSummary:
+    """What the load dialog lists for a profile; read without its body."""
+    key: str
+    name: str = ""
+    email: str = ""
+    modified_at: Optional[float] = None
+
+
+class ProfileRepository(ABC):
+    """Storage for Resume.to_dict() payloads, keyed by profile name."""
+    
+    @abstractmethod
+    def names(self) -> List[str]:
+        """Return stored profile keys without reading any profile body."""
+    
+    @abstractmethod
+    def load(self, key: str) -> Optional[dict]:
+        """Load a single profile, or None if it is unknown."""
+    
+    @abstractmethod
+    def save(self, key: str, data: dict) -> None:
+        """Add or update one profile."""
+    
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a profile if it exists."""
+    
+    def summaries(self) -> List[ProfileSummary]:
+        """
+        Name and metadata of every stored profile, in names() order.
+        Backends override this to serve it from their index; no profile
+        body is read.
+        """
+        return [ProfileSummary(key) for key in self.names()]
+    
+    def save_many(self, items: Iterable[Tuple[str, dict]]) -> None:
+        """Add or update several profiles."""
+        for key, data in items:
+            self.save(key, data)
+    
+    def load_all(self) -> Dict[str, dict]:
+        """Load every stored profile."""
+        return {key: self.load(key) for key in self.names()}
+    
+    def close(self) -> None:
+        """Release any resource held by the backend."""
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.names()
+    
+    def __len__(self) -> int:
+        return len(self.names())
+
+
+class JsonFileRepository(ProfileRepository):
+    """
+    Legacy single-file store (profiles.json).
+    Every save rewrites the whole file, but atomically.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._profiles: Optional[Dict[str, dict]] = None
+    
+    @property
+    def profiles(self) -> Dict[str, dict]:
+        if self._profiles is None:
+            self._profiles = {}
+            if self.path.exists():
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._profiles = json.load(f)
+        return self._profiles
+    
+    def names(self) -> List[str]:
+        return list(self.profiles)
+    
+    def load(self, key: str) -> Optional[dict]:
+        return self.profiles.get(key)
+    
+    def load_all(self) -> Dict[str, dict]:
+        return dict(self.profiles)
+    
+    def summaries(self) -> List[ProfileSummary]:
+        # The whole file is parsed anyway, so the bodies are free here
+        return [
+            ProfileSummary(
+                key,
+                f"{data.get('first_name', '')} {data.get('last_name', '')}".strip(),
+                data.get("email", ""),
+            )
+            for key, data in self.profiles.items()
+        ]
+    
+    def save(self, key: str, data: dict) -> None:
+        self.save_many([(key, data)])
+    
+    def save_many(self, items: Iterable[Tuple[str, dict]]) -> None:
+        self.profiles.update(items)
+        self._write()
+    
+    def delete(self, key: str) -> None:
+        if self.profiles.pop(key, None) is not None:
+            self._write()
+    
+    def _write(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(self.path, self.profiles)
+
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+JOURNAL_SUFFIX = ".journal"
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+DEFAULT_REPOSITORY_PATH = DATA_DIR / "profiles.db"
+
+# Earlier layouts, imported once into an empty default repository
+LEGACY_REPOSITORY_PATHS = (
+    DATA_DIR / "profiles",
+    DATA_DIR / "profiles.json",
+)
+
+# Written next to a repository once the legacy import has been done
+MIGRATION_MARKER_SUFFIX = ".migrated"
+
+
+def _open_backend(path: Path, codec: Optional[str] = None) -> ProfileRepository:
+    """
+    Pick the backend from the path: *.db -> SQLite, *.journal -> append-only
+    journal, *.json -> single file, anything else -> a shard directory.
+    codec overrides the backend's payload format (see storage.codecs).
+    """
+    from storage.journal_store import JournalProfileRepository
+    from storage.sharded_store import ShardedProfileStore
+    from storage.sqlite_repository import SQLiteProfileRepository
+    
+    options = {} if codec is None else {"codec": codec}
+    path = Path(path)
+    if path.suffix in SQLITE_SUFFIXES:
+        return SQLiteProfileRepository(path, **options)
+    if path.suffix == JOURNAL_SUFFIX:
+        return JournalProfileRepository(path, **options)
+    if path.suffix == ".json":
+        if codec not in (None, "json"):
+            raise ValueError(f"Un fichier .json ne peut contenir que du JSON (format demandé: {codec})")
+        return JsonFileRepository(path)
+    return ShardedProfileStore(path, **options)
+
+
+def migrate_profiles(source: ProfileRepository, target: ProfileRepository) -> int:
+    """Copy every profile from one repository to another. Returns the number copied."""
+    profiles = source.load_all()
+    target.save_many(profiles.items())
+    return len(profiles)
+
+
+def migration_marker(path: Path) -> Path:
+    """File recording that the legacy profiles were imported into path."""
+    path = Path(path)
+    return path.with_name(path.name + MIGRATION_MARKER_SUFFIX)
+
+
+def open_repository(
+    path: Path,
+    legacy_paths: Iterable[Path] = (),
+    codec: Optional[str] = None,
+) -> ProfileRepository:
+    """
+    Open the repository stored at path.
+    
+    When it is still empty, profiles are imported from the first existing
+    legacy location (e.g. data/profiles/ or data/profiles.json). This only
+    happens once: a marker file (see migration_marker()) is then written,
+    so deleting every profile later does not bring the old ones back.
+    New payloads are written with codec (backend default if None); every
+    known format is still read.
+    """
+    repository = _open_backend(path, codec)
+    legacy_paths = list(legacy_paths)
+    marker = migration_marker(path)
+    if not legacy_paths or marker.exists():
+        return repository
+    
+    try:
+        source = None
+        if len(repository) == 0:
+            for legacy_path in legacy_paths:
+                legacy_path = Path(legacy_path)
+                if not legacy_path.exists() or legacy_path == Path(path):
+                    continue
+                legacy = _open_backend(legacy_path)
+                try:
+                    copied = migrate_profiles(legacy, repository)
+                finally:
+                    legacy.close()
+                if copied:
+                    source = legacy_path
+                    break
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(marker, f"{source or ''}\n".encode("utf-8"))
+    except BaseException:
+        repository.close()
+        raise
+    return repository
+
+
+def open_default_repository() -> ProfileRepository:
+    """
+    Open data/profiles.db, importing older layouts the first time.
+    The CVFORGE_PROFILES environment variable selects another location/backend.
+    """
+    path = os.environ.get("CVFORGE_PROFILES")
+    if path:
+        return open_repository(Path(path), LEGACY_REPOSITORY_PATHS)
+    return open_repository(DEFAULT_REPOSITORY_PATH, LEGACY_REPOSITORY_PATHS)
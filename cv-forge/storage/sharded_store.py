@@ -0,0 +1,142 @@
+"""
+Sharded profile storage for CV-Forge.
+One file per profile (JSON by default) plus a small index, so saving a
+profile only rewrites that profile's file.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from storage.codecs import decode_profile, get_codec
+from storage.repository import ProfileRepository, ProfileSummary, atomic_write_bytes, atomic_write_json
+
+
+class ShardedProfileStore(ProfileRepository):
+    """
+    Profile store laid out as a directory:
+        
+        profiles/
+        ├── index.json              # profile key -> shard file name
+        ├── jean-dupont-1a2b3c4d.json
+        └── ...
+    
+    The index is only rewritten when a profile is added or removed, or
+    when its shard is rewritten with another codec.
+    """
+    
+    INDEX_NAME = "index.json"
+    
+    def __init__(self, root: Path, codec: str = "json"):
+        self.root = Path(root)
+        self.codec = get_codec(codec)
+        self.index_path = self.root / self.INDEX_NAME
+        self._index: Optional[Dict[str, str]] = None
+    
+    @property
+    def initialized(self) -> bool:
+        """True once the store directory has an index."""
+        return self.index_path.exists()
+    
+    @property
+    def index(self) -> Dict[str, str]:
+        if self._index is None:
+            self._index = {}
+            if self.index_path.exists():
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+        return self._index
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+    
+    def __len__(self) -> int:
+        return len(self.index)
+    
+    def names(self) -> List[str]:
+        return list(self.index)
+    
+    def summaries(self) -> List[ProfileSummary]:
+        """Keys from the index and save times from the shard files."""
+        summaries = []
+        for key, shard in self.index.items():
+            try:
+                modified_at = os.stat(self.root / shard).st_mtime
+            except OSError:
+                modified_at = None
+            summaries.append(ProfileSummary(key, modified_at=modified_at))
+        return summaries
+    
+    def load(self, key: str) -> Optional[dict]:
+        shard = self.index.get(key)
+        if shard is None:
+            return None
+        with open(self.root / shard, "rb") as f:
+            return decode_profile(f.read())
+    
+    def save(self, key: str, data: dict) -> None:
+        """Add or update one profile, touching only its own shard."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        
+        previous = self.index.get(key)
+        shard = self._target_shard(key, previous)
+        self._write_shard(shard, data)
+        
+        if shard != previous or not self.initialized:
+            self.index[key] = shard
+            self._write_index()
+            self._remove_shard(previous, shard)
+    
+    def save_many(self, items: Iterable[Tuple[str, dict]]) -> None:
+        """Write several shards, then the index once."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        replaced = []
+        for key, data in items:
+            previous = self.index.get(key)
+            shard = self._target_shard(key, previous)
+            self._write_shard(shard, data)
+            self.index[key] = shard
+            replaced.append((previous, shard))
+        self._write_index()
+        for previous, shard in replaced:
+            self._remove_shard(previous, shard)
+    
+    def delete(self, key: str) -> None:
+        """Remove a profile and its shard."""
+        shard = self.index.pop(key, None)
+        if shard is None:
+            return
+        self._write_index()
+        self._remove_shard(shard)
+    
+    def _write_index(self) -> None:
+        atomic_write_json(self.index_path, self.index)
+    
+    def _target_shard(self, key: str, previous: Optional[str]) -> str:
+        """Keep the current shard unless it was written with another codec."""
+        if previous is not None and previous.endswith(self.codec.extension):
+            return previous
+        return self._shard_name(key)
+    
+    def _write_shard(self, shard: str, data: dict) -> None:
+        if self.codec.name == "json":
+            atomic_write_json(self.root / shard, data)  # Indented, readable by hand
+        else:
+            atomic_write_bytes(self.root / shard, self.codec.encode(data))
+    
+    def _remove_shard(self, shard: Optional[str], keep: Optional[str] = None) -> None:
+        if shard is None or shard == keep:
+            return
+        shard_path = self.root / shard
+        if shard_path.exists():
+            shard_path.unlink()
+    
+    def _shard_name(self, key: str) -> str:
+        """Readable, collision-free file name for a profile key."""
+        slug = re.sub(r"[^a-z0-9]+", "-", key.lower()).strip("-")[:40] or "profil"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+        return f"{slug}-{digest}{self.codec.extension}"
+
@@ -0,0 +1,117 @@
+"""
+SQLite profile repository for CV-Forge.
+Stores Resume.to_dict() payloads (JSON by default, rows written with
+an opt-in binary codec still load) with indexed name, email and last-modified columns.
+Writes are transactional: a crash mid-save never damages the other
+profiles.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from storage.codecs import decode_profile, get_codec
+from storage.repository import ProfileRepository, ProfileSummary
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    key         TEXT PRIMARY KEY,
+    name        TEXT NOT NULL,
+    email       TEXT NOT NULL DEFAULT '',
+    modified_at REAL NOT NULL,
+    payload     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_name ON profiles (name, key);
+CREATE INDEX IF NOT EXISTS idx_profiles_email ON profiles (email);
+CREATE INDEX IF NOT EXISTS idx_profiles_modified ON profiles (modified_at);
+"""
+
+
+class SQLiteProfileRepository(ProfileRepository):
+    """Profile repository backed by a single SQLite database file."""
+    
+    def __init__(self, path: Path, codec: str = "json"):
+        self.path = Path(path)
+        self.codec = get_codec(codec)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+    
+    def names(self) -> List[str]:
+        """Profile keys sorted by name (served from the name index)."""
+        rows = self.conn.execute("SELECT key FROM profiles ORDER BY name, key")
+        return [row[0] for row in rows]
+    
+    def summaries(self) -> List[ProfileSummary]:
+        """Names, emails and save times from the indexed columns."""
+        rows = self.conn.execute(
+            "SELECT key, name, email, modified_at FROM profiles ORDER BY name, key"
+        )
+        return [ProfileSummary(*row) for row in rows]
+    
+    def recent(self, limit: int = 20) -> List[str]:
+        """Most recently saved profile keys."""
+        rows = self.conn.execute(
+            "SELECT key FROM profiles ORDER BY modified_at DESC LIMIT ?", (limit,)
+        )
+        return [row[0] for row in rows]
+    
+    def find_by_email(self, email: str) -> List[str]:
+        """Profile keys registered with the given email."""
+        rows = self.conn.execute("SELECT key FROM profiles WHERE email = ?", (email,))
+        return [row[0] for row in rows]
+    
+    def load(self, key: str) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT payload FROM profiles WHERE key = ?", (key,)
+        ).fetchone()
+        return decode_profile(row[0]) if row else None
+    
+    def save(self, key: str, data: dict) -> None:
+        self.save_many([(key, data)])
+    
+    def save_many(self, items: Iterable[Tuple[str, dict]]) -> None:
+        """Upsert profiles in a single transaction."""
+        now = time.time()
+        rows = [
+            (
+                key,
+                f"{data.get('first_name', '')} {data.get('last_name', '')}".strip(),
+                data.get("email", ""),
+                now,
+                self.codec.encode(data),
+            )
+            for key, data in items
+        ]
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO profiles (key, name, email, modified_at, payload)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    name = excluded.name,
+                    email = excluded.email,
+                    modified_at = excluded.modified_at,
+                    payload = excluded.payload
+                """,
+                rows,
+            )
+    
+    def delete(self, key: str) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM profiles WHERE key = ?", (key,))
+    
+    def close(self) -> None:
+        self.conn.close()
+    
+    def __contains__(self, key: str) -> bool:
+        row = self.conn.execute("SELECT 1 FROM profiles WHERE key = ?", (key,)).fetchone()
+        return row is not None
+    
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
@@ -0,0 +1,161 @@
+"""
+Background export queue for CV-Forge.
+Renders documents on a worker thread so the Tk main loop stays responsive.
+"""
+
+import os
+import queue
+import stat
+import tempfile
+import threading
+from typing import Callable, Optional
+
+
+def _current_umask() -> int:
+    # os.umask() can only be read by setting it; done once, at import time
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _current_umask()
+
+
+def _output_mode(filepath: str) -> int:
+    """
+    Permissions a direct write would give filepath: those of the file it
+    replaces, or the usual umask-based ones (mkstemp files are 0600).
+    """
+    try:
+        return stat.S_IMODE(os.stat(filepath).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+class ExportJob:
+    """
+    One queued export: render(path) writes the document to path.
+    
+    Non-atomic jobs render straight to filepath (e.g. a folder receiving
+    several files); cancelling them only skips them while still queued.
+    """
+    
+    def __init__(self, label: str, filepath: str, render: Callable[[str], None], atomic: bool = True):
+        self.label = label
+        self.filepath = filepath
+        self.render = render
+        self.atomic = atomic
+        self.error: Optional[str] = None
+        self._cancelled = threading.Event()
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+    
+    def cancel(self) -> None:
+        """Skip the job if queued, or discard its output if already rendering."""
+        self._cancelled.set()
+
+
+class ExportQueue:
+    """
+    Runs export jobs one after another on a daemon worker thread.
+    
+    Tk widgets must only be touched from the main thread, so finished jobs
+    are handed back through a queue that is polled with widget.after().
+    Documents are rendered to a temporary file next to the target and only
+    moved into place if the job wasn't cancelled meanwhile.
+    """
+    
+    POLL_MS = 100
+    
+    def __init__(
+        self,
+        widget,
+        on_done: Callable[[ExportJob], None],
+        on_change: Optional[Callable[[], None]] = None,
+    ):
+        self.widget = widget
+        self.on_done = on_done
+        self.on_change = on_change
+        self._jobs: "queue.Queue[ExportJob]" = queue.Queue()
+        self._finished: "queue.Queue[ExportJob]" = queue.Queue()
+        self._pending = []
+        self._worker: Optional[threading.Thread] = None
+        self._polling = False
+    
+    @property
+    def pending(self) -> int:
+        """Jobs submitted and not yet reported back (including the running one)."""
+        return len(self._pending)
+    
+    def submit(self, label: str, filepath: str, render: Callable[[str], None], atomic: bool = True) -> ExportJob:
+        job = ExportJob(label, filepath, render, atomic)
+        self._pending.append(job)
+        self._jobs.put(job)
+        
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="cv-forge-export", daemon=True)
+            self._worker.start()
+        
+        self._schedule_poll()
+        self._notify_change()
+        return job
+    
+    def cancel_all(self) -> None:
+        for job in self._pending:
+            job.cancel()
+        self._notify_change()
+    
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if not job.cancelled:
+                self._execute(job)
+            self._finished.put(job)
+    
+    @staticmethod
+    def _execute(job: ExportJob) -> None:
+        tmp_path = None
+        try:
+            if not job.atomic:
+                job.render(job.filepath)
+                return
+            
+            directory = os.path.dirname(os.path.abspath(job.filepath))
+            suffix = os.path.splitext(job.filepath)[1]
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".cv-forge-", suffix=suffix)
+            os.close(fd)
+            
+            job.render(tmp_path)
+            if not job.cancelled:
+                os.chmod(tmp_path, _output_mode(job.filepath))
+                os.replace(tmp_path, job.filepath)
+        except Exception as e:
+            job.error = str(e)
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _schedule_poll(self) -> None:
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.POLL_MS, self._poll)
+    
+    def _poll(self) -> None:
+        self._polling = False
+        while True:
+            try:
+                job = self._finished.get_nowait()
+            except queue.Empty:
+                break
+            self._pending.remove(job)
+            self._notify_change()
+            self.on_done(job)
+        
+        if self._pending:
+            self._schedule_poll()
+    
+    def _notify_change(self) -> None:
+        if self.on_change:
+            self.on_change()
@@ -13,6 +13,7 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.resume import Education, Certification, Experience
+from ui.virtual_list import VirtualList
 
 
 class PersonalInfoFrame(ctk.CTkFrame):
@@ -133,14 +134,27 @@ class PersonalInfoFrame(ctk.CTkFrame):
         }
     
     def set_data(self, data: dict):
-        """Populate form with data."""
-        self.first_name_entry.insert(0, data.get("first_name", ""))
-        self.last_name_entry.insert(0, data.get("last_name", ""))
-        self.phone_entry.insert(0, data.get("phone", ""))
-        self.email_entry.insert(0, data.get("email", ""))
-        self.linkedin_entry.insert(0, data.get("linkedin", ""))
-        self.address_entry.insert(0, data.get("address", ""))
-        self.profile_text.insert("1.0", data.get("profile", ""))
+        """Populate form with data, replacing what is currently entered."""
+        self._set_entry(self.first_name_entry, data.get("first_name", ""))
+        self._set_entry(self.last_name_entry, data.get("last_name", ""))
+        self._set_entry(self.phone_entry, data.get("phone", ""))
+        self._set_entry(self.email_entry, data.get("email", ""))
+        self._set_entry(self.linkedin_entry, data.get("linkedin", ""))
+        self._set_entry(self.address_entry, data.get("address", ""))
+        
+        profile = data.get("profile", "")
+        if self.profile_text.get("1.0", "end-1c") != profile:
+            self.profile_text.delete("1.0", "end")
+            self.profile_text.insert("1.0", profile)
+    
+    @staticmethod
+    def _set_entry(entry: ctk.CTkEntry, value: str):
+        # Untouched fields are left alone to avoid needless redraws
+        if entry.get() == value:
+            return
+        entry.delete(0, "end")
+        if value:
+            entry.insert(0, value)
 
 
 class EducationFrame(ctk.CTkFrame):
@@ -221,9 +235,9 @@ class EducationFrame(ctk.CTkFrame):
         )
         list_title.grid(row=2, column=0, sticky="w", pady=(10, 8), padx=10)
         
-        self.entries_list = ctk.CTkScrollableFrame(main_scroll, height=200)
+        # Only the visible rows have widgets, recycled while scrolling
+        self.entries_list = VirtualList(main_scroll, format_row=self._format_entry, height=200)
         self.entries_list.grid(row=3, column=0, sticky="ew", padx=10, pady=(0, 10))
-        self.entries_list.grid_columnconfigure(0, weight=1)
     
     def _add_entry(self):
         diploma = self.diploma_entry.get()
@@ -240,20 +254,7 @@ class EducationFrame(ctk.CTkFrame):
             "dates": dates,
         })
         
-        # Add to visual list with better styling
-        entry_container = ctk.CTkFrame(self.entries_list, fg_color="gray25")
-        entry_container.pack(fill="x", pady=4)
-        entry_container.grid_columnconfigure(0, weight=1)
-        
-        text = f"📚 {diploma}\n   📍 {institution} • {dates}"
-        entry_label = ctk.CTkLabel(
-            entry_container,
-            text=text,
-            anchor="w",
-            justify="left",
-            font=("Helvetica", 10)
-        )
-        entry_label.pack(fill="x", padx=10, pady=8)
+        self.entries_list.set_items(self.education_entries, scroll_to_end=True)
         
         self._clear_fields()
     
@@ -266,25 +267,13 @@ class EducationFrame(ctk.CTkFrame):
         return self.education_entries
     
     def set_data(self, data: List[dict]):
-        self.education_entries = []
-        for widget in self.entries_list.winfo_children():
-            widget.destroy()
-        
-        for edu in data:
-            self.education_entries.append(edu)
-            entry_container = ctk.CTkFrame(self.entries_list, fg_color="gray25")
-            entry_container.pack(fill="x", pady=4)
-            entry_container.grid_columnconfigure(0, weight=1)
-            
-            text = f"📚 {edu['diploma']}\n   📍 {edu['institution']} • {edu['dates']}"
-            entry_label = ctk.CTkLabel(
-                entry_container,
-                text=text,
-                anchor="w",
-                justify="left",
-                font=("Helvetica", 10)
-            )
-            entry_label.pack(fill="x", padx=10, pady=8)
+        self.education_entries = list(data)
+        self.entries_list.set_items(self.education_entries)
+        self._clear_fields()
+    
+    @staticmethod
+    def _format_entry(edu: dict) -> str:
+        return f"📚 {edu['diploma']}\n   📍 {edu['institution']} • {edu['dates']}"
 
 
 class CertificationFrame(ctk.CTkFrame):
@@ -365,9 +354,9 @@ class CertificationFrame(ctk.CTkFrame):
         )
         list_title.grid(row=2, column=0, sticky="w", pady=(10, 8), padx=10)
         
-        self.entries_list = ctk.CTkScrollableFrame(main_scroll, height=200)
+        # Only the visible rows have widgets, recycled while scrolling
+        self.entries_list = VirtualList(main_scroll, format_row=self._format_entry, height=200)
         self.entries_list.grid(row=3, column=0, sticky="ew", padx=10, pady=(0, 10))
-        self.entries_list.grid_columnconfigure(0, weight=1)
     
     def _add_entry(self):
         name = self.name_entry.get()
@@ -384,19 +373,7 @@ class CertificationFrame(ctk.CTkFrame):
             "year": year,
         })
         
-        entry_container = ctk.CTkFrame(self.entries_list, fg_color="gray25")
-        entry_container.pack(fill="x", pady=4)
-        entry_container.grid_columnconfigure(0, weight=1)
-        
-        text = f"🎖️ {name}\n   🏢 {org} • {year}"
-        entry_label = ctk.CTkLabel(
-            entry_container,
-            text=text,
-            anchor="w",
-            justify="left",
-            font=("Helvetica", 10)
-        )
-        entry_label.pack(fill="x", padx=10, pady=8)
+        self.entries_list.set_items(self.certification_entries, scroll_to_end=True)
         
         self._clear_fields()
     
@@ -409,25 +386,13 @@ class CertificationFrame(ctk.CTkFrame):
         return self.certification_entries
     
     def set_data(self, data: List[dict]):
-        self.certification_entries = []
-        for widget in self.entries_list.winfo_children():
-            widget.destroy()
-        
-        for cert in data:
-            self.certification_entries.append(cert)
-            entry_container = ctk.CTkFrame(self.entries_list, fg_color="gray25")
-            entry_container.pack(fill="x", pady=4)
-            entry_container.grid_columnconfigure(0, weight=1)
-            
-            text = f"🎖️ {cert['name']}\n   🏢 {cert['organization']} • {cert['year']}"
-            entry_label = ctk.CTkLabel(
-                entry_container,
-                text=text,
-                anchor="w",
-                justify="left",
-                font=("Helvetica", 10)
-            )
-            entry_label.pack(fill="x", padx=10, pady=8)
+        self.certification_entries = list(data)
+        self.entries_list.set_items(self.certification_entries)
+        self._clear_fields()
+    
+    @staticmethod
+    def _format_entry(cert: dict) -> str:
+        return f"🎖️ {cert['name']}\n   🏢 {cert['organization']} • {cert['year']}"
 
 
 class ExperienceFrame(ctk.CTkFrame):
@@ -541,9 +506,9 @@ class ExperienceFrame(ctk.CTkFrame):
         )
         list_title.grid(row=2, column=0, sticky="w", pady=(10, 8), padx=10)
         
-        self.entries_list = ctk.CTkScrollableFrame(main_scroll, height=200)
+        # Only the visible rows have widgets, recycled while scrolling
+        self.entries_list = VirtualList(main_scroll, format_row=self._format_entry, height=200)
         self.entries_list.grid(row=3, column=0, sticky="ew", padx=10, pady=(0, 10))
-        self.entries_list.grid_columnconfigure(0, weight=1)
     
     def _add_entry(self):
         position = self.position_entry.get()
@@ -568,20 +533,7 @@ class ExperienceFrame(ctk.CTkFrame):
             "bullets": bullets,
         })
         
-        entry_container = ctk.CTkFrame(self.entries_list, fg_color="gray25")
-        entry_container.pack(fill="x", pady=4)
-        entry_container.grid_columnconfigure(0, weight=1)
-        
-        dates_str = f"{start} → {end}" if start and end else "Dates non spécifiées"
-        text = f"🏢 {position} • {company}\n   📍 {city} | {dates_str}"
-        entry_label = ctk.CTkLabel(
-            entry_container,
-            text=text,
-            anchor="w",
-            justify="left",
-            font=("Helvetica", 10)
-        )
-        entry_label.pack(fill="x", padx=10, pady=8)
+        self.entries_list.set_items(self.experience_entries, scroll_to_end=True)
         
         self._clear_fields()
     
@@ -597,26 +549,15 @@ class ExperienceFrame(ctk.CTkFrame):
         return self.experience_entries
     
     def set_data(self, data: List[dict]):
-        self.experience_entries = []
-        for widget in self.entries_list.winfo_children():
-            widget.destroy()
-        
-        for exp in data:
-            self.experience_entries.append(exp)
-            entry_container = ctk.CTkFrame(self.entries_list, fg_color="gray25")
-            entry_container.pack(fill="x", pady=4)
-            entry_container.grid_columnconfigure(0, weight=1)
-            
-            dates_str = f"{exp['start_date']} → {exp['end_date']}"
-            text = f"🏢 {exp['position']} • {exp['company']}\n   📍 {exp['city']} | {dates_str}"
-            entry_label = ctk.CTkLabel(
-                entry_container,
-                text=text,
-                anchor="w",
-                justify="left",
-                font=("Helvetica", 10)
-            )
-            entry_label.pack(fill="x", padx=10, pady=8)
+        self.experience_entries = list(data)
+        self.entries_list.set_items(self.experience_entries)
+        self._clear_fields()
+    
+    @staticmethod
+    def _format_entry(exp: dict) -> str:
+        start, end = exp['start_date'], exp['end_date']
+        dates_str = f"{start} → {end}" if start and end else "Dates non spécifiées"
+        return f"🏢 {exp['position']} • {exp['company']}\n   📍 {exp['city']} | {dates_str}"
 
 
 class SkillsFrame(ctk.CTkFrame):
@@ -756,12 +697,12 @@ class SkillsFrame(ctk.CTkFrame):
         self.hard_skills = data.get("skills_hard", [])
         self.soft_skills = data.get("skills_soft", [])
         
-        # Clear textboxes first
-        self.hard_text.delete("1.0", "end")
-        self.soft_text.delete("1.0", "end")
-        
-        self.hard_text.insert("1.0", "\n".join(self.hard_skills))
-        self.soft_text.insert("1.0", "\n".join(self.soft_skills))
+        # Replace the textbox content only when it differs
+        for textbox, skills in ((self.hard_text, self.hard_skills), (self.soft_text, self.soft_skills)):
+            content = "\n".join(skills)
+            if textbox.get("1.0", "end-1c") != content:
+                textbox.delete("1.0", "end")
+                textbox.insert("1.0", content)
         
         hard_display = "\n".join([f"✓ {s}" for s in self.hard_skills]) if self.hard_skills else "Aucune compétence"
         soft_display = "\n".join([f"✓ {s}" for s in self.soft_skills]) if self.soft_skills else "Aucune compétence"
@@ -5,12 +5,16 @@ CustomTkinter tabbed interface for resume building.
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-import json
-from pathlib import Path
+import importlib
+import threading
+import time
 
 from models.resume import Resume, Education, Certification, Experience
-from exporters.docx_exporter import DOCXExporter
-from exporters.pdf_exporter import PDFExporter
+from storage.repository import ProfileSummary, open_default_repository
+from storage.sqlite_repository import SQLiteProfileRepository
+from ui.export_queue import ExportQueue
+from ui.preview import LivePreview
+from ui.virtual_list import VirtualList
 from ui.forms import (
     PersonalInfoFrame,
     EducationFrame,
@@ -20,6 +24,36 @@ from ui.forms import (
 )
 
 
+# The exporters pull in reportlab and python-docx, so they are imported on
+# first export (or warmed up in the background once the window is shown).
+EXPORTER_MODULES = ("exporters.pdf_exporter", "exporters.docx_exporter")
+
+
+def _render_pdf(resume: Resume, filepath: str) -> None:
+    from exporters.pdf_exporter import PDFExporter
+    PDFExporter(resume).export(filepath)
+
+
+def _render_docx(resume: Resume, filepath: str) -> None:
+    from exporters.docx_exporter import DOCXExporter
+    DOCXExporter(resume).export(filepath)
+
+
+def _render_all(resume: Resume, directory: str) -> None:
+    from exporters.multi_format import export_all
+    failures = [result for result in export_all(resume, directory) if not result.ok]
+    if failures:
+        raise Exception("\n".join(f"{result.fmt.upper()}: {result.error}" for result in failures))
+
+
+def _warm_up_exporters() -> None:
+    for name in EXPORTER_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # Reported by the export itself
+
+
 class MainWindow(ctk.CTk):
     """Main application window with tabbed interface."""
     
@@ -38,13 +72,37 @@ class MainWindow(ctk.CTk):
         self.load_icon = "📂"
         self.pdf_icon = "📄"
         self.docx_icon = "📝"
+        self.all_icon = "📦"
         self.refresh_icon = "🔄"
         
         self.resume = Resume()
-        self.profiles_path = Path(__file__).parent.parent / "data" / "profiles.json"
+        self.repository = self._open_repository()
+        self.export_queue = ExportQueue(self, on_done=self._on_export_done, on_change=self._update_export_status)
         
         self._build_ui()
-        self._load_profiles()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Runs once the first frame has been drawn
+        self.after_idle(self._start_exporter_warm_up)
+    
+    def _open_repository(self):
+        """
+        Open the profile store; if it (or a legacy file being imported) is
+        unreadable, keep the app usable with an in-memory store and say so.
+        """
+        try:
+            return open_default_repository()
+        except Exception as e:
+            message = (
+                f"Impossible d'ouvrir les profils sauvegardés:\n{str(e)}\n\n"
+                "Les profils enregistrés pendant cette session ne seront pas conservés."
+            )
+            self.after_idle(lambda: messagebox.showerror("Erreur", message))
+            return SQLiteProfileRepository(":memory:")
+    
+    def _start_exporter_warm_up(self):
+        """Import the exporters in the background so the first export starts fast."""
+        threading.Thread(target=_warm_up_exporters, name="cv-forge-warm-up", daemon=True).start()
     
     def _build_ui(self):
         """Build the main UI with tabs and action buttons."""
@@ -77,7 +135,7 @@ class MainWindow(ctk.CTk):
         subtitle_label.grid(row=1, column=0, sticky="w", pady=(0, 10))
         
         # Tab view
-        self.tabview = ctk.CTkTabview(header_frame)
+        self.tabview = ctk.CTkTabview(header_frame, command=self._on_tab_changed)
         self.tabview.grid(row=2, column=0, sticky="nsew", pady=(0, 15))
         header_frame.grid_rowconfigure(2, weight=1)
         
@@ -87,7 +145,8 @@ class MainWindow(ctk.CTk):
         self.tab_certifications = self.tabview.add("🏆 Certifications")
         self.tab_experience = self.tabview.add("💼 Expériences")
         self.tab_skills = self.tabview.add("⭐ Compétences")
-        self.tab_preview = self.tabview.add("👁️ Aperçu")
+        self.preview_tab_name = "👁️ Aperçu"
+        self.tab_preview = self.tabview.add(self.preview_tab_name)
         
         # Add forms to tabs with scrollable frames
         self.personal_form = PersonalInfoFrame(self.tab_personal)
@@ -112,6 +171,15 @@ class MainWindow(ctk.CTk):
         self.preview_text = ctk.CTkTextbox(preview_container, width=800, height=500)
         self.preview_text.pack(fill="both", expand=True, pady=(0, 10))
         
+        # Live preview: debounced, only changed sections are re-rendered
+        self.live_preview = LivePreview(
+            self.preview_text,
+            self._collect_form_data,
+            is_visible=lambda: self.tabview.get() == self.preview_tab_name,
+        )
+        self.bind_all("<KeyRelease>", self.live_preview.schedule, add="+")
+        self.bind_all("<ButtonRelease-1>", self.live_preview.schedule, add="+")
+        
         update_btn = ctk.CTkButton(
             preview_container,
             text=f"{self.refresh_icon} Actualiser l'aperçu",
@@ -152,6 +220,35 @@ class MainWindow(ctk.CTk):
             hover_color="#2980b9"
         ).pack(side="left", padx=5)
         
+        # Export progress (hidden while idle)
+        self.export_status_frame = ctk.CTkFrame(self.btn_frame, fg_color="transparent")
+        self.export_status_frame.grid(row=0, column=1, sticky="ew", padx=10)
+        self.export_status_frame.grid_columnconfigure(0, weight=1)
+        
+        self.export_status_label = ctk.CTkLabel(
+            self.export_status_frame,
+            text="",
+            font=("Helvetica", 10),
+            text_color="gray"
+        )
+        self.export_status_label.grid(row=0, column=0, sticky="ew")
+        
+        self.export_progress = ctk.CTkProgressBar(self.export_status_frame, mode="indeterminate")
+        self.export_progress.grid(row=1, column=0, sticky="ew", pady=(2, 0))
+        
+        ctk.CTkButton(
+            self.export_status_frame,
+            text="✖ Annuler",
+            command=self.export_queue.cancel_all,
+            width=90,
+            height=28,
+            font=("Helvetica", 10),
+            fg_color="gray40",
+            hover_color="gray30"
+        ).grid(row=0, column=1, rowspan=2, padx=(8, 0))
+        
+        self.export_status_frame.grid_remove()
+        
         # Right side buttons (Export)
         right_frame = ctk.CTkFrame(self.btn_frame, fg_color="transparent")
         right_frame.grid(row=0, column=2, sticky="e", padx=5)
@@ -177,6 +274,17 @@ class MainWindow(ctk.CTk):
             fg_color="#9b59b6",
             hover_color="#8e44ad"
         ).pack(side="left", padx=5)
+        
+        ctk.CTkButton(
+            right_frame,
+            text=f"{self.all_icon} Exporter tout",
+            command=self._export_all,
+            width=160,
+            height=40,
+            font=("Helvetica", 11),
+            fg_color="#16a085",
+            hover_color="#138d75"
+        ).pack(side="left", padx=5)
     
     def _collect_form_data(self) -> Resume:
         """Collect all form data into a Resume object."""
@@ -211,81 +319,12 @@ class MainWindow(ctk.CTk):
         return self.resume
     
     def _update_preview(self):
-        """Update the preview tab with current resume data."""
-        resume = self._collect_form_data()
-        
-        preview_content = []
-        
-        # Header
-        preview_content.append("=" * 60)
-        preview_content.append(resume.full_name.center(60))
-        preview_content.append("=" * 60)
-        
-        contact_lines = []
-        if resume.phone:
-            contact_lines.append(resume.phone)
-        if resume.email:
-            contact_lines.append(resume.email)
-        if resume.linkedin:
-            contact_lines.append(resume.linkedin)
-        if resume.address:
-            contact_lines.append(resume.address)
-        
-        if contact_lines:
-            preview_content.append(" | ".join(contact_lines).center(60))
-        
-        preview_content.append("")
-        
-        # Profile
-        if resume.profile:
-            preview_content.append("PROFIL")
-            preview_content.append("-" * 40)
-            preview_content.append(resume.profile)
-            preview_content.append("")
-        
-        # Education
-        if resume.education:
-            preview_content.append("FORMATION")
-            preview_content.append("-" * 40)
-            for edu in resume.education:
-                preview_content.append(f"  {edu.diploma} – {edu.institution} – {edu.dates}")
-            preview_content.append("")
-        
-        # Certifications
-        if resume.certifications:
-            preview_content.append("CERTIFICATION")
-            preview_content.append("-" * 40)
-            for cert in resume.certifications:
-                preview_content.append(f"  {cert.name} – {cert.organization} – {cert.year}")
-            preview_content.append("")
-        
-        # Experiences
-        if resume.experiences:
-            preview_content.append("EXPERIENCES PROFESSIONNELLES")
-            preview_content.append("-" * 40)
-            for exp in resume.experiences:
-                dates_range = f"{exp.start_date} – {exp.end_date}"
-                preview_content.append(f"  {exp.position} – {exp.company} – {exp.city} – {dates_range}")
-                for bullet in exp.bullets:
-                    preview_content.append(f"    • {bullet}")
-            preview_content.append("")
-        
-        # Skills
-        if resume.skills_hard or resume.skills_soft:
-            preview_content.append("COMPETENCES")
-            preview_content.append("-" * 40)
-            if resume.skills_hard:
-                preview_content.append("  Competences Techniques:")
-                for skill in resume.skills_hard:
-                    preview_content.append(f"    • {skill}")
-            if resume.skills_soft:
-                preview_content.append("  Competences Comportementales:")
-                for skill in resume.skills_soft:
-                    preview_content.append(f"    • {skill}")
-        
-        # Update textbox
-        self.preview_text.delete("1.0", "end")
-        self.preview_text.insert("1.0", "\n".join(preview_content))
+        """Bring the preview tab up to date with the forms."""
+        self.live_preview.refresh()
+    
+    def _on_tab_changed(self):
+        if self.tabview.get() == self.preview_tab_name:
+            self.live_preview.on_shown()
     
     def _export_pdf(self):
         """Export resume to PDF."""
@@ -302,12 +341,7 @@ class MainWindow(ctk.CTk):
         )
         
         if filepath:
-            try:
-                exporter = PDFExporter(resume)
-                exporter.export(filepath)
-                messagebox.showinfo("Succès", f"CV exporté avec succès ✓\n{filepath}")
-            except Exception as e:
-                messagebox.showerror("Erreur d'export", f"Erreur lors de l'export PDF:\n{str(e)}")
+            self.export_queue.submit("PDF", filepath, lambda path: _render_pdf(resume, path))
     
     def _export_docx(self):
         """Export resume to DOCX."""
@@ -324,52 +358,84 @@ class MainWindow(ctk.CTk):
         )
         
         if filepath:
-            try:
-                exporter = DOCXExporter(resume)
-                exporter.export(filepath)
-                messagebox.showinfo("Succès", f"CV exporté avec succès ✓\n{filepath}")
-            except Exception as e:
-                messagebox.showerror("Erreur d'export", f"Erreur lors de l'export DOCX:\n{str(e)}")
+            self.export_queue.submit("DOCX", filepath, lambda path: _render_docx(resume, path))
     
-    def _save_profile(self):
-        """Save current profile to JSON file."""
+    def _export_all(self):
+        """Export resume to PDF, DOCX and text in one go."""
         resume = self._collect_form_data()
         
         if not resume.first_name or not resume.last_name:
             messagebox.showwarning("Attention", "Veuillez entrer au moins le nom et le prénom")
             return
         
-        # Ensure data directory exists
-        self.profiles_path.parent.mkdir(parents=True, exist_ok=True)
+        directory = filedialog.askdirectory(title="Dossier de destination")
         
-        # Load existing profiles
-        profiles = self._load_profiles()
+        if directory:
+            self.export_queue.submit(
+                "PDF + DOCX + TXT",
+                directory,
+                lambda path: _render_all(resume, path),
+                atomic=False,
+            )
+    
+    def _on_export_done(self, job):
+        """Report a finished background export (runs on the Tk main thread)."""
+        if job.cancelled:
+            return
+        if job.error:
+            messagebox.showerror("Erreur d'export", f"Erreur lors de l'export {job.label}:\n{job.error}")
+        else:
+            messagebox.showinfo("Succès", f"CV exporté avec succès ✓\n{job.filepath}")
+    
+    def _update_export_status(self):
+        """Show progress while exports are queued or running."""
+        pending = self.export_queue.pending
+        if not pending:
+            self.export_progress.stop()
+            self.export_status_frame.grid_remove()
+            return
         
-        # Add/update current profile
-        profile_key = f"{resume.first_name} {resume.last_name}"
-        profiles[profile_key] = resume.to_dict()
+        text = "Export en cours..."
+        if pending > 1:
+            text += f" ({pending - 1} en attente)"
+        self.export_status_label.configure(text=text)
+        self.export_status_frame.grid()
+        self.export_progress.start()
+    
+    def _on_close(self):
+        """Cancel pending exports before closing the window."""
+        self.export_queue.cancel_all()
+        self.destroy()
+    
+    def _save_profile(self):
+        """Save current profile to the profile repository."""
+        resume = self._collect_form_data()
         
-        # Save profiles
-        with open(self.profiles_path, "w", encoding="utf-8") as f:
-            json.dump(profiles, f, indent=2, ensure_ascii=False)
+        if not resume.first_name or not resume.last_name:
+            messagebox.showwarning("Attention", "Veuillez entrer au moins le nom et le prénom")
+            return
+        
+        # Add/update current profile (single transactional upsert)
+        profile_key = f"{resume.first_name} {resume.last_name}"
+        try:
+            self.repository.save(profile_key, resume.to_dict())
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Impossible de sauvegarder le profil:\n{str(e)}")
+            return
         
         messagebox.showinfo("Succès", f"Profil sauvegardé sous: {profile_key}")
     
-    def _load_profiles(self) -> dict:
-        """Load all profiles from JSON file."""
-        if self.profiles_path.exists():
-            try:
-                with open(self.profiles_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except:
-                pass
-        return {}
-    
     def _load_profile(self):
-        """Load a profile from JSON file."""
-        profiles = self._load_profiles()
-        
-        if not profiles:
+        """
+        Let the user pick a saved profile. The list comes from the
+        repository's summaries; only the selected body is read.
+        """
+        try:
+            summaries = self.repository.summaries()
+        except Exception:
+            summaries = []
+        
+        if not summaries:
             messagebox.showinfo("Info", "Aucun profil sauvegardé")
             return
         
@@ -382,56 +448,39 @@ class MainWindow(ctk.CTk):
         
         ctk.CTkLabel(dialog, text="Sélectionnez un profil:", font=("", 12, "bold")).pack(pady=10)
         
-        listbox_frame = ctk.CTkScrollableFrame(dialog, width=350, height=200)
-        listbox_frame.pack(fill="both", expand=True, padx=10, pady=5)
-        
-        def on_select(profile_name):
-            data = profiles[profile_name]
-            self._populate_forms(data)
+        def on_select(summary):
+            try:
+                data = self.repository.load(summary.key)
+            except Exception as e:
+                messagebox.showerror("Erreur", f"Impossible de charger le profil:\n{str(e)}", parent=dialog)
+                return
+            if data is not None:
+                self._populate_forms(data)
             dialog.destroy()
         
-        for profile_name in profiles.keys():
-            btn = ctk.CTkButton(
-                listbox_frame,
-                text=profile_name,
-                command=lambda name=profile_name: on_select(name),
-                width=300,
-            )
-            btn.pack(fill="x", pady=2)
+        profile_list = VirtualList(
+            dialog,
+            format_row=self._format_profile_summary,
+            row_height=40,
+            height=200,
+            on_click=on_select,
+        )
+        profile_list.pack(fill="both", expand=True, padx=10, pady=5)
+        profile_list.set_items(summaries)
         
         ctk.CTkButton(dialog, text="Annuler", command=dialog.destroy, width=100).pack(pady=10)
     
+    @staticmethod
+    def _format_profile_summary(summary: ProfileSummary) -> str:
+        text = summary.name or summary.key
+        if summary.email:
+            text += f"  ·  {summary.email}"
+        if summary.modified_at:
+            text += f"  ·  {time.strftime('%d/%m/%Y %H:%M', time.localtime(summary.modified_at))}"
+        return text
+    
     def _populate_forms(self, data: dict):
-        """Populate all forms with loaded profile data."""
-        # Destroy existing forms
-        for widget in self.tab_personal.winfo_children():
-            widget.destroy()
-        for widget in self.tab_education.winfo_children():
-            widget.destroy()
-        for widget in self.tab_certifications.winfo_children():
-            widget.destroy()
-        for widget in self.tab_experience.winfo_children():
-            widget.destroy()
-        for widget in self.tab_skills.winfo_children():
-            widget.destroy()
-        
-        # Recreate forms
-        self.personal_form = PersonalInfoFrame(self.tab_personal)
-        self.personal_form.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        self.education_form = EducationFrame(self.tab_education)
-        self.education_form.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        self.certification_form = CertificationFrame(self.tab_certifications)
-        self.certification_form.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        self.experience_form = ExperienceFrame(self.tab_experience)
-        self.experience_form.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        self.skills_form = SkillsFrame(self.tab_skills)
-        self.skills_form.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Populate with data
+        """Populate all forms with loaded profile data, reusing the existing widgets."""
         self.personal_form.set_data(data)
         self.education_form.set_data(data.get("education", []))
         self.certification_form.set_data(data.get("certifications", []))
@@ -440,3 +489,4 @@ class MainWindow(ctk.CTk):
             "skills_hard": data.get("skills_hard", []),
             "skills_soft": data.get("skills_soft", []),
         })
+        self.live_preview.schedule()
@@ -0,0 +1,107 @@
+"""
+Live preview for CV-Forge.
+Renders the resume as plain text, one section at a time, and patches only
+the sections of the preview textbox whose data changed.
+"""
+
+from typing import Callable, List, Optional
+
+from models.document import SECTIONS as DOCUMENT_SECTIONS, ResumeDocument, build_document
+from models.plain_text import render_node
+from models.resume import Resume
+
+
+def _nodes(document: ResumeDocument) -> list:
+    """Header then body sections: one preview slot each."""
+    return [document.header, *document.sections]
+
+
+# Preview slots in display order
+SECTIONS = ("header",) + tuple(key for key, _, _ in DOCUMENT_SECTIONS)
+
+
+class LivePreview:
+    """
+    Keeps a textbox in sync with the forms.
+    
+    Each section starts at a Tk text mark. On refresh, every section of
+    the resume's document tree is compared with the last rendered one;
+    only sections that changed are re-rendered, and only their range of
+    the textbox is replaced. Edits are debounced so typing does not
+    refresh on every key.
+    """
+    
+    DELAY_MS = 300
+    
+    def __init__(
+        self,
+        textbox,
+        collect: Callable[[], Resume],
+        is_visible: Optional[Callable[[], bool]] = None,
+        delay_ms: int = DELAY_MS,
+    ):
+        self.textbox = textbox
+        self.collect = collect
+        self.is_visible = is_visible
+        self.delay_ms = delay_ms
+        self._nodes: List[Optional[object]] = [None] * len(SECTIONS)
+        self._pending: Optional[str] = None
+        
+        self.textbox.delete("1.0", "end")
+        for name in SECTIONS:
+            self.textbox.mark_set(self._mark(name), "1.0")
+            self.textbox.mark_gravity(self._mark(name), "left")
+    
+    def schedule(self, *_) -> None:
+        """Refresh once the user has stopped editing for delay_ms."""
+        if self._pending is not None:
+            self.textbox.after_cancel(self._pending)
+        self._pending = self.textbox.after(self.delay_ms, self._on_timer)
+    
+    def on_shown(self) -> None:
+        """Bring the preview up to date when it becomes visible."""
+        self.refresh()
+    
+    def refresh(self) -> int:
+        """Patch every changed section now. Returns the number of sections patched."""
+        if self._pending is not None:
+            self.textbox.after_cancel(self._pending)
+            self._pending = None
+        return self.update(self.collect())
+    
+    def update(self, resume: Resume) -> int:
+        """Patch the sections of resume that differ from the last update."""
+        patched = 0
+        for index, node in enumerate(_nodes(build_document(resume))):
+            if node == self._nodes[index]:
+                continue
+            self._replace(index, render_node(node))
+            self._nodes[index] = node
+            patched += 1
+        return patched
+    
+    def _on_timer(self) -> None:
+        self._pending = None
+        if self.is_visible is not None and not self.is_visible():
+            return  # Refreshed by on_shown() instead
+        self.refresh()
+    
+    def _replace(self, index: int, text: str) -> None:
+        start = self._mark(SECTIONS[index])
+        end = self._mark(SECTIONS[index + 1]) if index + 1 < len(SECTIONS) else "end-1c"
+        
+        # Empty sections share their mark position: keep earlier marks before
+        # the inserted text and push later ones after it
+        for position, name in enumerate(SECTIONS):
+            self.textbox.mark_gravity(self._mark(name), "left" if position <= index else "right")
+        
+        self.textbox.delete(start, end)
+        if text:
+            self.textbox.insert(start, text)
+        
+        for name in SECTIONS:
+            self.textbox.mark_gravity(self._mark(name), "left")
+    
+    @staticmethod
+    def _mark(name: str) -> str:
+        return f"preview-{name}"
@@ -0,0 +1,155 @@
+"""
+Virtualized list widget for CV-Forge.
+Shows a long list of entries with a fixed pool of row widgets that are
+recycled as the list scrolls.
+"""
+
+import customtkinter as ctk
+from typing import Callable, List, Optional
+
+
+class VirtualList(ctk.CTkFrame):
+    """
+    Scrollable list of text rows whose widget count does not depend on the
+    number of items.
+    
+    Only enough rows to fill the visible height are created; scrolling
+    changes which items they display instead of moving widgets. Items are
+    rendered with format_row(item) -> str; on_click(item), if given, is
+    called when a row is clicked.
+    """
+    
+    def __init__(
+        self,
+        master,
+        format_row: Callable[[object], str],
+        row_height: int = 56,
+        height: int = 200,
+        on_click: Optional[Callable[[object], None]] = None,
+        **kwargs
+    ):
+        super().__init__(master, height=height, **kwargs)
+        self.format_row = format_row
+        self.on_click = on_click
+        self.row_height = row_height
+        self.items: List[object] = []
+        self.first = 0
+        self._rows: List[ctk.CTkFrame] = []
+        self._labels: List[ctk.CTkLabel] = []
+        self._visible = max(1, height // row_height)
+        
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        
+        self.rows_frame = ctk.CTkFrame(self, fg_color="transparent", height=height)
+        self.rows_frame.grid(row=0, column=0, sticky="nsew")
+        self.rows_frame.pack_propagate(False)
+        
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        
+        self.rows_frame.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self.rows_frame)
+        self._ensure_pool()
+        self._redraw()
+    
+    def set_items(self, items: List[object], scroll_to_end: bool = False) -> None:
+        """
+        Display items (kept by reference). Call again after changing the
+        list; a different list starts scrolled to the top.
+        """
+        if items is not self.items:
+            self.first = 0
+        self.items = items
+        if scroll_to_end:
+            self.first = len(items)  # Clamped by _redraw
+        self._redraw()
+    
+    def scroll_to(self, index: int) -> None:
+        """Scroll so that the row at index is visible."""
+        if index < self.first:
+            self.first = index
+        elif index >= self.first + self._visible:
+            self.first = index - self._visible + 1
+        self._redraw()
+    
+    def _ensure_pool(self) -> None:
+        """Create row widgets until the visible height is covered."""
+        while len(self._rows) < self._visible:
+            row = ctk.CTkFrame(self.rows_frame, fg_color="gray25")
+            row.grid_columnconfigure(0, weight=1)
+            label = ctk.CTkLabel(
+                row,
+                text="",
+                anchor="w",
+                justify="left",
+                font=("Helvetica", 10)
+            )
+            label.pack(fill="x", padx=10, pady=8)
+            self._bind_wheel(row)
+            self._bind_wheel(label)
+            if self.on_click is not None:
+                slot = len(self._rows)
+                row.configure(cursor="hand2")
+                label.configure(cursor="hand2")
+                row.bind("<Button-1>", lambda event, slot=slot: self._on_row_click(slot))
+                label.bind("<Button-1>", lambda event, slot=slot: self._on_row_click(slot))
+            self._rows.append(row)
+            self._labels.append(label)
+    
+    def _redraw(self) -> None:
+        count = len(self.items)
+        self.first = max(0, min(self.first, count - self._visible))
+        
+        for slot, (row, label) in enumerate(zip(self._rows, self._labels)):
+            index = self.first + slot
+            if slot < self._visible and index < count:
+                text = self.format_row(self.items[index])
+                if label.cget("text") != text:
+                    label.configure(text=text)
+                if not row.winfo_manager():
+                    row.pack(fill="x", pady=4)
+            else:
+                row.pack_forget()
+        
+        if count <= self._visible:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.first / count, (self.first + self._visible) / count)
+    
+    def _on_row_click(self, slot: int) -> None:
+        index = self.first + slot
+        if index < len(self.items):
+            self.on_click(self.items[index])
+    
+    def _scroll_by(self, rows: int) -> None:
+        self.first += rows
+        self._redraw()
+    
+    def _on_scrollbar(self, action: str, amount: str, unit: Optional[str] = None) -> None:
+        if action == "moveto":
+            self.first = round(float(amount) * len(self.items))
+            self._redraw()
+        elif action == "scroll":
+            step = self._visible if unit == "pages" else 1
+            self._scroll_by(int(amount) * step)
+    
+    def _on_wheel(self, event) -> None:
+        if getattr(event, "num", None) == 4:
+            self._scroll_by(-1)
+        elif getattr(event, "num", None) == 5:
+            self._scroll_by(1)
+        elif event.delta:
+            self._scroll_by(-1 if event.delta > 0 else 1)
+    
+    def _on_resize(self, event) -> None:
+        visible = max(1, event.height // self.row_height)
+        if visible != self._visible:
+            self._visible = visible
+            self._ensure_pool()
+            self._redraw()
+    
+    def _bind_wheel(self, widget) -> None:
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", self._on_wheel)
+        widget.bind("<Button-5>", self._on_wheel)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Add cv-forge directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "cv-forge"))
@@ -0,0 +1,23 @@
+"""Batch export of stored profiles."""
+
+import os
+
+from exporters.batch import export_profiles
+
+
+def test_profiles_sharing_a_name_do_not_overwrite_each_other(tmp_path):
+    profiles = {
+        "jean-1": {"first_name": "Jean", "last_name": "Dupont", "email": "jean@example.fr"},
+        "jean-2": {"first_name": "Jean", "last_name": "Dupont", "email": "jean.dupont@example.fr"},
+        "jean-3": {"first_name": "jean", "last_name": "DUPONT"},
+    }
+    results = export_profiles(profiles, tmp_path, formats=["txt"], jobs=1)
+    
+    paths = {result.profile: os.path.basename(result.filepath) for result in results}
+    assert paths == {
+        "jean-1": "Dupont_Jean_CV.txt",
+        "jean-2": "Dupont_Jean_CV_2.txt",
+        "jean-3": "DUPONT_jean_CV_3.txt",
+    }
+    assert "jean.dupont@example.fr" in (tmp_path / "Dupont_Jean_CV_2.txt").read_text(encoding="utf-8")
+    assert sorted(os.listdir(tmp_path)) == sorted(paths.values())
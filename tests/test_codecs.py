@@ -0,0 +1,86 @@
+"""Profile codecs: round-trips, format detection and corrupt payloads."""
+
+import pytest
+
+from benchmarks.synthetic import make_sized_resume
+from models.resume import Resume
+from storage.codecs import CODECS, BinaryCodec, _FramedCodec, decode_profile, detect_codec, get_codec
+from storage.repository import open_repository
+
+
+PROFILES = [
+    Resume().to_dict(),
+    make_sized_resume("large").to_dict(),
+    {"first_name": "Zoé", "last_name": "Ünal 東京 🚀", "certifications": [{"name": "A", "organization": "", "year": 2020}]},
+]
+
+
+@pytest.mark.parametrize("name", list(CODECS))
+@pytest.mark.parametrize("data", PROFILES)
+def test_round_trip(name, data):
+    codec = get_codec(name)
+    payload = codec.encode(data)
+    assert codec.decode(payload) == data
+    assert detect_codec(payload) is codec
+    assert decode_profile(payload) == data
+
+
+def test_compressed_binary_is_smaller():
+    data = make_sized_resume("large").to_dict()
+    payload = get_codec("binary-zlib").encode(data)
+    assert len(payload) * 2 < len(get_codec("json").encode(data))
+    assert detect_codec(payload).name == "binary-zlib"
+    assert get_codec("binary").decode(payload) == data
+
+
+def test_framed_codecs_must_define_their_body_format():
+    class Incomplete(_FramedCodec):
+        MAGIC = b"TEST"
+    
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_json_text_payload_is_decoded():
+    assert decode_profile('{"first_name": "Jean"}') == {"first_name": "Jean"}
+
+
+def test_truncated_binary_payload_is_rejected():
+    payload = get_codec("binary").encode(PROFILES[1])
+    with pytest.raises(ValueError):
+        decode_profile(payload[:-10])
+
+
+def test_newer_binary_version_is_rejected():
+    payload = bytearray(get_codec("binary").encode(PROFILES[0]))
+    payload[4] = BinaryCodec.VERSION + 1
+    with pytest.raises(ValueError, match="non supportée"):
+        decode_profile(bytes(payload))
+
+
+def test_unknown_payload_is_rejected():
+    with pytest.raises(ValueError):
+        decode_profile(b"\x00\x01garbage")
+
+
+def test_unknown_codec_name():
+    with pytest.raises(ValueError):
+        get_codec("xml")
+
+
+@pytest.mark.parametrize("store", ["profiles.db", "profiles.journal", "profiles"])
+@pytest.mark.parametrize("name", list(CODECS))
+def test_stores_read_every_codec(tmp_path, store, name):
+    path = tmp_path / store
+    repository = open_repository(path, codec=name)
+    repository.save("a", PROFILES[1])
+    repository.close()
+    
+    # Reopened with the default codec: old payloads still load next to new ones
+    repository = open_repository(path)
+    repository.save("b", PROFILES[2])
+    try:
+        assert repository.load("a") == PROFILES[1]
+        assert repository.load("b") == PROFILES[2]
+    finally:
+        repository.close()
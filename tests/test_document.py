@@ -0,0 +1,46 @@
+"""Document tree shared by the exporters."""
+
+import io
+
+import pytest
+
+from exporters.batch import EXPORTERS
+from exporters.docx_exporter import DOCXExporter
+from models.document import ItemBlock, build_document
+from models.resume import Resume
+
+
+# Profiles written by hand or by other tools may store numbers
+NUMERIC_FIELDS = {
+    "first_name": "Jean",
+    "last_name": "Dupont",
+    "education": [{"diploma": "Master", "institution": "Université de Lyon", "dates": 2020}],
+    "certifications": [{"name": "PMP", "organization": "PMI", "year": 2020}],
+    "experiences": [{
+        "position": "Chef de projet",
+        "company": "Acme",
+        "city": "Lyon",
+        "start_date": 2018,
+        "end_date": 2020,
+        "bullets": ["Budget de", 150000],
+    }],
+    "skills_hard": ["Python", 3],
+}
+
+
+def test_numeric_fields_are_converted():
+    document = build_document(Resume.from_dict(NUMERIC_FIELDS))
+    
+    assert document.section("education").blocks == (ItemBlock("Master – Université de Lyon – 2020"),)
+    assert document.section("certifications").blocks == (ItemBlock("PMP – PMI – 2020"),)
+    experience, = document.section("experiences").blocks
+    assert experience.heading == "Chef de projet – Acme – Lyon – 2018 – 2020"
+    assert experience.bullets == ("Budget de", "150000")
+    assert document.section("skills").blocks[0].items == ("Python", "3")
+
+
+@pytest.mark.parametrize("exporter", [*EXPORTERS.values(), DOCXExporter])
+def test_numeric_fields_export(exporter):
+    content = exporter(Resume.from_dict(NUMERIC_FIELDS)).export_to_bytes()
+    
+    assert content
@@ -0,0 +1,85 @@
+"""
+The streaming DOCX engine must write the same package parts as the
+python-docx engine.
+"""
+
+import io
+import zipfile
+
+import docx
+import pytest
+
+from benchmarks.synthetic import SIZES, make_sized_resume
+from models.resume import Certification, Education, Experience, Resume
+from exporters.docx_exporter import DOCXExporter
+
+
+def _parts(data: bytes) -> dict:
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        return {info.filename: package.read(info) for info in package.infolist()}
+
+
+def _engines(resume: Resume):
+    return (
+        DOCXExporter(resume).export_to_bytes(),
+        DOCXExporter(resume, engine="stream").export_to_bytes(),
+    )
+
+
+def _tricky_resume() -> Resume:
+    """Markup characters, tabs, line breaks, edge whitespace and empty fields."""
+    resume = Resume(
+        first_name="Zoé",
+        last_name="O'Brien & <Fils>",
+        email="zoe@example.fr",
+        profile="  Ligne 1\nLigne\t2\r\n\"cités\" > 3  ",
+    )
+    resume.education.append(Education("", "École \"Sup\"", ""))
+    resume.certifications.append(Certification("A&B", "", "2020"))
+    resume.experiences.append(Experience("", "", "", "", "", ["", " tête", "fin\t", "a\n\nb"]))
+    resume.experiences.append(Experience("Dev", "Acme", "Paris", "01/2020", "Présent", []))
+    resume.skills_hard = ["C++ <STL>", "", " "]
+    resume.skills_soft = ["Écoute"]
+    return resume
+
+
+@pytest.mark.parametrize("size", list(SIZES))
+def test_stream_engine_matches_python_docx(size):
+    reference, streamed = _engines(make_sized_resume(size))
+    assert _parts(streamed) == _parts(reference)
+
+
+@pytest.mark.parametrize("resume", [Resume(), _tricky_resume()], ids=["empty", "tricky"])
+def test_stream_engine_matches_python_docx_on_edge_cases(resume):
+    reference, streamed = _engines(resume)
+    assert _parts(streamed) == _parts(reference)
+
+
+def test_stream_output_opens_with_python_docx():
+    resume = make_sized_resume("medium")
+    reference, streamed = _engines(resume)
+    expected = docx.Document(io.BytesIO(reference))
+    document = docx.Document(io.BytesIO(streamed))
+    assert [(p.style.name, p.text) for p in document.paragraphs] == [
+        (p.style.name, p.text) for p in expected.paragraphs
+    ]
+
+
+def test_stream_engine_rejects_control_characters_like_python_docx():
+    resume = Resume(first_name="Jean\x01")
+    for engine in DOCXExporter.ENGINES:
+        with pytest.raises(Exception, match="XML compatible"):
+            DOCXExporter(resume, engine=engine).export_to_bytes()
+
+
+def test_document_changes_do_not_leak_into_later_exports():
+    resume = make_sized_resume("small")
+    expected = _parts(DOCXExporter(resume).export_to_bytes())
+    
+    changed = DOCXExporter(resume)
+    changed.doc.styles["Normal"].font.bold = True
+    changed.doc.core_properties.author = "Quelqu'un"
+    changed.doc.settings.odd_and_even_pages_header_footer = True
+    changed.export_to_bytes()
+    
+    assert _parts(DOCXExporter(resume).export_to_bytes()) == expected
@@ -0,0 +1,90 @@
+"""One-time import of legacy profile stores into the default repository."""
+
+import json
+
+import pytest
+
+from storage.repository import migration_marker, open_repository
+from storage.sharded_store import ShardedProfileStore
+
+
+PROFILES = {
+    "Jean Dupont": {"first_name": "Jean", "last_name": "Dupont", "email": "jean@example.fr"},
+    "Zoé Martin": {"first_name": "Zoé", "last_name": "Martin"},
+}
+
+
+@pytest.fixture
+def legacy_json(tmp_path):
+    path = tmp_path / "profiles.json"
+    path.write_text(json.dumps(PROFILES, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def _open(tmp_path, *legacy_paths):
+    return open_repository(tmp_path / "profiles.db", [tmp_path / "profiles", *legacy_paths])
+
+
+def test_legacy_json_is_imported(tmp_path, legacy_json):
+    repository = _open(tmp_path, legacy_json)
+    try:
+        assert repository.load_all() == PROFILES
+    finally:
+        repository.close()
+    assert migration_marker(tmp_path / "profiles.db").exists()
+
+
+def test_legacy_directory_is_imported_first(tmp_path, legacy_json):
+    store = ShardedProfileStore(tmp_path / "profiles")
+    store.save("Paul Durand", {"first_name": "Paul", "last_name": "Durand"})
+    
+    repository = _open(tmp_path, legacy_json)
+    try:
+        assert repository.names() == ["Paul Durand"]
+    finally:
+        repository.close()
+
+
+def test_deleted_profiles_are_not_imported_again(tmp_path, legacy_json):
+    repository = _open(tmp_path, legacy_json)
+    for key in repository.names():
+        repository.delete(key)
+    repository.close()
+    
+    repository = _open(tmp_path, legacy_json)
+    try:
+        assert len(repository) == 0
+    finally:
+        repository.close()
+
+
+def test_populated_repository_is_not_merged_with_legacy(tmp_path, legacy_json):
+    repository = open_repository(tmp_path / "profiles.db")
+    repository.save("Paul Durand", {"first_name": "Paul"})
+    repository.close()
+    
+    repository = _open(tmp_path, legacy_json)
+    try:
+        assert repository.names() == ["Paul Durand"]
+    finally:
+        repository.close()
+    assert migration_marker(tmp_path / "profiles.db").exists()
+
+
+def test_failed_import_is_retried(tmp_path, legacy_json):
+    legacy_json.write_text("{pas du json", encoding="utf-8")
+    with pytest.raises(ValueError):
+        _open(tmp_path, legacy_json)
+    assert not migration_marker(tmp_path / "profiles.db").exists()
+    
+    legacy_json.write_text(json.dumps(PROFILES), encoding="utf-8")
+    repository = _open(tmp_path, legacy_json)
+    try:
+        assert repository.load_all() == PROFILES
+    finally:
+        repository.close()
+
+
+def test_no_marker_without_legacy_paths(tmp_path):
+    open_repository(tmp_path / "profiles.db").close()
+    assert not migration_marker(tmp_path / "profiles.db").exists()
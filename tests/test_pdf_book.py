@@ -0,0 +1,40 @@
+"""Several resumes in one PDF, one outline entry per candidate."""
+
+import io
+
+import pytest
+
+pypdf = pytest.importorskip("pypdf")
+
+from benchmarks.synthetic import make_sized_resume
+from exporters.pdf_book import PDFBookExporter
+from exporters.pdf_exporter import PDFExporter
+from models.resume import Resume
+
+
+def _pages(content: bytes) -> int:
+    return len(pypdf.PdfReader(io.BytesIO(content)).pages)
+
+
+def test_book_pages_and_outline():
+    resumes = [
+        make_sized_resume("small"),
+        make_sized_resume("large"),
+        Resume(first_name="  ", last_name=""),
+    ]
+    reader = pypdf.PdfReader(io.BytesIO(PDFBookExporter(iter(resumes)).export_to_bytes()))
+    
+    pages = [_pages(PDFExporter(resume, engine="platypus").export_to_bytes()) for resume in resumes]
+    assert len(reader.pages) == sum(pages)
+    
+    outline = [(entry.title, reader.get_destination_page_number(entry)) for entry in reader.outline]
+    assert outline == [
+        (resumes[0].full_name, 0),
+        (resumes[1].full_name, pages[0]),
+        ("Candidat 3", pages[0] + pages[1]),
+    ]
+
+
+def test_empty_book_is_rejected():
+    with pytest.raises(Exception, match="Aucun CV"):
+        PDFBookExporter([]).export_to_bytes()
@@ -0,0 +1,78 @@
+"""
+The direct-canvas PDF engine must draw the same text at the same
+positions as the platypus layout.
+"""
+
+import io
+import random
+
+import pytest
+
+pypdf = pytest.importorskip("pypdf")
+
+from benchmarks.synthetic import make_resume, make_sized_resume
+from models.document import build_document
+from models.resume import Resume
+from exporters import pdf_canvas
+from exporters.pdf_exporter import PDFExporter
+from exporters.pdf_styles import get_styles
+
+
+def _placed_text(data: bytes) -> list:
+    """(text, x, y) of every text run, page by page, plus the extracted text."""
+    pages = []
+    for page in pypdf.PdfReader(io.BytesIO(data)).pages:
+        runs = []
+        
+        def visit(text, cm, tm, font, size):
+            if text.strip():
+                x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4]
+                y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+                runs.append((text.strip(), round(x, 2), round(y, 2)))
+        
+        text = page.extract_text(visitor_text=visit)
+        pages.append((runs, text))
+    return pages
+
+
+def _one_page_resume(seed: int) -> Resume:
+    rng = random.Random(seed)
+    return make_resume(
+        experiences=rng.randint(0, 2),
+        bullets=rng.randint(0, 2),
+        education=rng.randint(0, 2),
+        certifications=rng.randint(0, 2),
+        skills=rng.randint(0, 10),
+        seed=seed,
+    )
+
+
+def _canvas_layout(resume: Resume):
+    return pdf_canvas.layout(build_document(resume), get_styles())
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_canvas_engine_matches_platypus(seed):
+    resume = _one_page_resume(seed)
+    assert _canvas_layout(resume) is not None, "le CV doit passer par le moteur canvas"
+    
+    canvas = PDFExporter(resume).export_to_bytes()
+    platypus = PDFExporter(resume, engine="platypus").export_to_bytes()
+    assert _placed_text(canvas) == _placed_text(platypus)
+
+
+@pytest.mark.parametrize("text", ["R&D <b>", "espace\xa0insécable", "mot" * 80])
+def test_unsupported_text_falls_back_to_platypus(text):
+    resume = Resume(first_name="Jean", last_name="Dupont", profile=text)
+    assert _canvas_layout(resume) is None
+
+
+def test_empty_name_falls_back_to_platypus():
+    # platypus still draws an empty paragraph for it
+    assert _canvas_layout(Resume()) is None
+
+
+def test_multi_page_resume_falls_back_to_platypus():
+    resume = make_sized_resume("large")
+    assert _canvas_layout(resume) is None
+    assert len(_placed_text(PDFExporter(resume).export_to_bytes())) > 1
@@ -0,0 +1,54 @@
+"""HTTP render service responses."""
+
+import http.client
+import json
+import threading
+
+import pytest
+
+from server.render_server import RenderServer, RenderService
+
+
+@pytest.fixture(scope="module")
+def server():
+    service = RenderService(workers=1, queue_size=1)
+    server = RenderServer(("127.0.0.1", 0), service)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def _post(server, fmt, data):
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=30)
+    try:
+        connection.request("POST", f"/render/{fmt}", json.dumps(data), {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        return response, response.read()
+    finally:
+        connection.close()
+
+
+def test_attachment_name(server):
+    response, body = _post(server, "txt", {"first_name": "Zoé", "last_name": "Martin"})
+    
+    assert response.status == 200
+    assert response.getheader("Content-Disposition") == (
+        "attachment; filename=\"Martin_Zo__CV.txt\"; filename*=UTF-8''Martin_Zo%C3%A9_CV.txt"
+    )
+    assert "ZOÉ MARTIN" in body.decode("utf-8")
+
+
+def test_line_breaks_in_name_cannot_inject_headers(server):
+    data = {"first_name": "Jean", "last_name": "Dupont\r\nX-Injected: 1\r\n\r\nfaux corps"}
+    response, body = _post(server, "txt", data)
+    
+    assert response.status == 200
+    assert response.getheader("X-Injected") is None
+    disposition = response.getheader("Content-Disposition")
+    assert "\r" not in disposition and "\n" not in disposition
+    assert disposition.startswith("attachment; filename=\"Dupont__X-Injected_ 1____faux corps_Jean_CV.txt\";")
+    assert len(body) == int(response.getheader("Content-Length"))
+    assert "JEAN DUPONT" in body.decode("utf-8")
@@ -0,0 +1,38 @@
+"""Export steps recorded by a Tracer."""
+
+from exporters.pdf_exporter import PDFExporter
+from exporters.tracing import Tracer
+from models.resume import Certification, Education, Resume
+
+
+def _resume(**fields) -> Resume:
+    resume = Resume(first_name="Jean", last_name="Dupont", email="jean@example.fr", profile="Chef de projet.", **fields)
+    resume.education.append(Education("Master", "Université de Lyon", "2018-2020"))
+    resume.certifications.append(Certification("PMP", "PMI", "2021"))
+    return resume
+
+
+def _steps(resume: Resume, **options) -> list:
+    with Tracer(memory=False) as tracer:
+        PDFExporter(resume, tracer=tracer, **options).export_to_bytes()
+    return [(record.name, record.args.get("section")) for record in tracer.records]
+
+
+def test_one_page_pdf_traces_each_section():
+    assert _steps(_resume()) == [
+        ("layout_header", None),
+        ("layout_section", "PROFIL"),
+        ("layout_section", "FORMATION"),
+        ("layout_section", "CERTIFICATION"),
+        ("draw", None),
+    ]
+
+
+def test_platypus_pdf_traces_each_section():
+    assert _steps(_resume(), engine="platypus") == [
+        ("_build_header", None),
+        ("_build_section", "PROFIL"),
+        ("_build_section", "FORMATION"),
+        ("_build_section", "CERTIFICATION"),
+        ("doc.build", None),
+    ]